@@ -0,0 +1,115 @@
+import time
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from graph import CSRGraph
+from task1 import DLSAgent, UCSAgent
+
+worker = {}
+
+
+def share_arrays(arrays):
+    blocks, specs = [], []
+    for array in arrays:
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, array.dtype, buffer=block.buf)[:] = array
+        blocks.append(block)
+        specs.append((block.name, array.shape, array.dtype.str))
+    return blocks, specs
+
+
+def attach_graph(specs):
+    arrays = []
+    for name, shape, dtype in specs:
+        block = shared_memory.SharedMemory(name=name)
+        worker.setdefault("blocks", []).append(block)
+        arrays.append(np.ndarray(shape, np.dtype(dtype), buffer=block.buf))
+    return CSRGraph(*arrays)
+
+
+def init_worker(graph, specs, reverse_specs, method, limit):
+    if graph is None:
+        graph = attach_graph(specs)
+        if reverse_specs is not None:
+            graph._reverse = attach_graph(reverse_specs)
+
+    if method in ("dls", "iddfs"):
+        agent = DLSAgent(graph)
+    else:
+        agent = UCSAgent(graph)
+
+    worker["search"] = {
+        "ucs": lambda initial, goal: agent.uniform_cost_search(initial, goal),
+        "bidirectional": lambda initial, goal: agent.bidirectional_search(
+            initial, goal
+        ),
+        "dls": lambda initial, goal: agent.depth_limited_search(initial, goal, limit),
+        "iddfs": lambda initial, goal: agent.iterative_deepening_search(
+            initial, goal, limit
+        )[0],
+    }[method]
+
+
+def run_query(query):
+    start = time.perf_counter()
+    result = worker["search"](*query)
+    return query, result, time.perf_counter() - start
+
+
+def run_queries(graph, queries, method="ucs", limit=None, processes=None, chunksize=16):
+    if method == "dls" and limit is None:
+        raise ValueError("method 'dls' needs a depth limit")
+
+    blocks = []
+    specs = reverse_specs = None
+
+    if isinstance(graph, CSRGraph):
+        new_blocks, specs = share_arrays([graph.offsets, graph.targets, graph.weights])
+        blocks += new_blocks
+        if method == "bidirectional":
+            reverse = graph.reverse()
+            new_blocks, reverse_specs = share_arrays(
+                [reverse.offsets, reverse.targets, reverse.weights]
+            )
+            blocks += new_blocks
+        graph = None
+
+    try:
+        with Pool(
+            processes,
+            initializer=init_worker,
+            initargs=(graph, specs, reverse_specs, method, limit),
+        ) as pool:
+            yield from pool.imap_unordered(run_query, queries, chunksize)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+if __name__ == "__main__":
+    import random
+
+    from graph import random_graph
+
+    graph = random_graph(10_000)
+    rng = random.Random(0)
+    queries = [(rng.randrange(10_000), rng.randrange(10_000)) for _ in range(1000)]
+
+    start = time.perf_counter()
+    agent = UCSAgent(graph)
+    for initial, goal in queries:
+        agent.uniform_cost_search(initial, goal)
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = sorted(latency for _, _, latency in run_queries(graph, queries))
+    batch_time = time.perf_counter() - start
+
+    print(f"Serial: {len(queries) / serial_time:.1f} queries/sec")
+    print(f"Batch:  {len(queries) / batch_time:.1f} queries/sec")
+    print(
+        f"Latency p50 {latencies[len(latencies) // 2] * 1000:.1f}ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f}ms"
+    )
@@ -0,0 +1,58 @@
+import random
+import time
+from itertools import permutations
+
+import numpy as np
+
+from task2 import branch_and_bound, held_karp
+
+
+def brute_force(dist):
+    n = len(dist)
+    best = None
+    for order in permutations(range(1, n)):
+        tour = [0, *order, 0]
+        cost = sum(dist[a][b] for a, b in zip(tour, tour[1:]))
+        if cost < np.inf and (best is None or cost < best[1]):
+            best = (tour, float(cost))
+    return best
+
+
+def random_matrix(n, rng, missing=0.0):
+    dist = np.array(
+        [[0 if i == j else rng.randint(1, 50) for j in range(n)] for i in range(n)],
+        dtype=float,
+    )
+    for i in range(n):
+        for j in range(n):
+            if i != j and rng.random() < missing:
+                dist[i, j] = np.inf
+    return dist
+
+
+def check(trials=300, seed=0):
+    rng = random.Random(seed)
+    mismatches = 0
+    for _ in range(trials):
+        dist = random_matrix(rng.randint(3, 7), rng, rng.choice([0.0, 0.3, 0.6]))
+        expected = brute_force(dist)
+        for solver in (held_karp, branch_and_bound):
+            result = solver(dist)
+            if (result is None) != (expected is None) or (
+                result is not None and result[1] != expected[1]
+            ):
+                mismatches += 1
+    return mismatches
+
+
+if __name__ == "__main__":
+    print(f"Mismatches against brute force: {check()}")
+
+    rng = random.Random(1)
+    for n in [10, 14, 18]:
+        dist = random_matrix(n, rng)
+        for solver in (held_karp, branch_and_bound):
+            start = time.perf_counter()
+            _, cost = solver(dist)
+            elapsed = time.perf_counter() - start
+            print(f"n={n} {solver.__name__:>16}: cost {cost:.0f} in {elapsed:.3f}s")
@@ -0,0 +1,63 @@
+import random
+import time
+
+from graph import random_geometric_graph, random_graph
+from task1 import UCSAgent
+
+
+def benchmark(num_nodes, queries=5, seed=0):
+    env = random_graph(num_nodes, seed=seed)
+    agent = UCSAgent(env)
+    rng = random.Random(seed)
+
+    expanded = 0
+    elapsed = 0.0
+    for _ in range(queries):
+        initial, goal = rng.randrange(num_nodes), rng.randrange(num_nodes)
+        start = time.perf_counter()
+        agent.uniform_cost_search(initial, goal)
+        elapsed += time.perf_counter() - start
+        expanded += agent.expanded
+
+    return expanded, elapsed
+
+
+def benchmark_bidirectional(num_nodes, queries=20, seed=0):
+    env = random_geometric_graph(num_nodes, radius=(8 / num_nodes) ** 0.5, seed=seed)
+    agent = UCSAgent(env)
+    rng = random.Random(seed)
+
+    results = {"unidirectional": [0, 0.0], "bidirectional": [0, 0.0]}
+    searches = {
+        "unidirectional": agent.uniform_cost_search,
+        "bidirectional": agent.bidirectional_search,
+    }
+    for _ in range(queries):
+        initial, goal = rng.randrange(num_nodes), rng.randrange(num_nodes)
+        for name, search in searches.items():
+            start = time.perf_counter()
+            search(initial, goal)
+            results[name][1] += time.perf_counter() - start
+            results[name][0] += agent.expanded
+
+    return results
+
+
+if __name__ == "__main__":
+    for num_nodes in [1_000, 10_000, 100_000, 1_000_000]:
+        expanded, elapsed = benchmark(num_nodes)
+        print(
+            f"{num_nodes:>9} nodes: {expanded:>9} expansions in {elapsed:.3f}s "
+            f"({expanded / elapsed:,.0f} expansions/sec)"
+        )
+
+    print()
+    for num_nodes in [1_000, 10_000, 100_000]:
+        results = benchmark_bidirectional(num_nodes)
+        (uni_settled, uni_time), (bi_settled, bi_time) = results.values()
+        print(
+            f"{num_nodes:>9} geometric nodes: {uni_settled:>9} settled "
+            f"({uni_time:.3f}s) unidirectional vs {bi_settled:>9} settled "
+            f"({bi_time:.3f}s) bidirectional, "
+            f"{uni_settled / bi_settled:.1f}x fewer"
+        )
@@ -0,0 +1,138 @@
+import os
+
+import numpy as np
+
+
+class CSRGraph:
+    def __init__(self, offsets, targets, weights):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.version = 0
+        self._reverse = None
+
+        self._offsets = memoryview(offsets)
+        self._targets = memoryview(targets)
+        self._weights = memoryview(weights)
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def get_nodes(self):
+        return range(self.num_nodes)
+
+    def get_neighbors(self, state):
+        return self._targets[self._offsets[state] : self._offsets[state + 1]]
+
+    def get_neighbors_with_cost(self, state):
+        start, end = self._offsets[state], self._offsets[state + 1]
+        return zip(self._targets[start:end], self._weights[start:end])
+
+    def get_reverse_neighbors_with_cost(self, state):
+        return self.reverse().get_neighbors_with_cost(state)
+
+    def reverse(self):
+        if self._reverse is None:
+            sources = np.repeat(
+                np.arange(self.num_nodes, dtype=np.int64), np.diff(self.offsets)
+            )
+            self._reverse = CSRGraph.from_edges(
+                self.targets, sources, self.weights, self.num_nodes
+            )
+            self._reverse._reverse = self
+        return self._reverse
+
+    @classmethod
+    def from_edges(cls, sources, targets, weights=None, num_nodes=None):
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if weights is None:
+            weights = np.ones(len(sources), dtype=np.int64)
+        weights = np.asarray(weights)
+        if num_nodes is None:
+            num_nodes = int(max(sources.max(initial=-1), targets.max(initial=-1))) + 1
+
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+
+        return cls(
+            offsets,
+            np.ascontiguousarray(targets[order]),
+            np.ascontiguousarray(weights[order]),
+        )
+
+    @classmethod
+    def load_edge_list(cls, path, num_nodes=None, undirected=False):
+        edges = np.loadtxt(path, comments="#", ndmin=2)
+        sources = edges[:, 0].astype(np.int64)
+        targets = edges[:, 1].astype(np.int64)
+        weights = None
+        if edges.shape[1] > 2:
+            weights = edges[:, 2]
+            if np.all(weights == np.round(weights)):
+                weights = weights.astype(np.int64)
+
+        if undirected:
+            sources, targets = (
+                np.concatenate([sources, targets]),
+                np.concatenate([targets, sources]),
+            )
+            if weights is not None:
+                weights = np.concatenate([weights, weights])
+
+        return cls.from_edges(sources, targets, weights, num_nodes)
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "offsets.npy"), self.offsets)
+        np.save(os.path.join(directory, "targets.npy"), self.targets)
+        np.save(os.path.join(directory, "weights.npy"), self.weights)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        mode = "r" if mmap else None
+        return cls(
+            np.load(os.path.join(directory, "offsets.npy"), mmap_mode=mode),
+            np.load(os.path.join(directory, "targets.npy"), mmap_mode=mode),
+            np.load(os.path.join(directory, "weights.npy"), mmap_mode=mode),
+        )
+
+
+def random_graph(num_nodes, degree=4, max_cost=10, seed=0):
+    rng = np.random.default_rng(seed)
+    num_edges = num_nodes * degree
+    sources = np.repeat(np.arange(num_nodes, dtype=np.int64), degree)
+    targets = rng.integers(0, num_nodes, num_edges, dtype=np.int64)
+    weights = rng.integers(1, max_cost + 1, num_edges, dtype=np.int64)
+    return CSRGraph.from_edges(sources, targets, weights, num_nodes)
+
+
+def random_geometric_graph(num_nodes, radius, scale=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    points = rng.random((num_nodes, 2))
+    points = points[np.argsort(points[:, 0])]
+    ends = np.searchsorted(points[:, 0], points[:, 0] + radius)
+
+    sources, targets, weights = [], [], []
+    for i in range(num_nodes):
+        others = np.arange(i + 1, ends[i])
+        distances = np.hypot(*(points[others] - points[i]).T)
+        near = distances <= radius
+        sources.append(np.full(near.sum(), i))
+        targets.append(others[near])
+        weights.append(np.ceil(distances[near] * scale).astype(np.int64))
+
+    sources, targets = np.concatenate(sources), np.concatenate(targets)
+    weights = np.concatenate(weights)
+    return CSRGraph.from_edges(
+        np.concatenate([sources, targets]),
+        np.concatenate([targets, sources]),
+        np.concatenate([weights, weights]),
+        num_nodes,
+    )
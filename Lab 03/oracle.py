@@ -0,0 +1,89 @@
+from functools import lru_cache
+
+import numpy as np
+
+from task1 import UCSAgent
+
+
+def floyd_warshall(env):
+    nodes = list(env.get_nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+
+    dist = np.full((n, n), np.inf)
+    hop = np.full((n, n), -1, dtype=np.int64)
+    np.fill_diagonal(dist, 0)
+    np.fill_diagonal(hop, np.arange(n))
+
+    for node in nodes:
+        i = index[node]
+        for neighbor, cost in env.get_neighbors_with_cost(node):
+            j = index[neighbor]
+            if cost < dist[i, j]:
+                dist[i, j] = cost
+                hop[i, j] = j
+
+    for k in range(n):
+        via = dist[:, k : k + 1] + dist[k : k + 1, :]
+        shorter = via < dist
+        dist = np.where(shorter, via, dist)
+        hop = np.where(shorter, hop[:, k : k + 1], hop)
+
+    return nodes, index, dist, hop
+
+
+class DistanceOracle:
+    def __init__(self, env, cache_size=128, dense_limit=500):
+        self.env = env
+        self.agent = UCSAgent(env)
+        self.dense_limit = dense_limit
+        self.tree = lru_cache(maxsize=cache_size)(self._build_tree)
+        self.matrix = lru_cache(maxsize=1)(self._build_matrix)
+
+    def _build_tree(self, version, source):
+        return self.agent.shortest_path_tree(source)
+
+    def _build_matrix(self, version):
+        return floyd_warshall(self.env)
+
+    def is_dense(self):
+        return len(self.env.get_nodes()) <= self.dense_limit
+
+    def query(self, source, goal):
+        if not self.is_dense():
+            return self.tree(self.env.version, source).query(goal)
+
+        nodes, index, dist, hop = self.matrix(self.env.version)
+        i, j = index[source], index[goal]
+        if np.isinf(dist[i, j]):
+            return None
+
+        path = [source]
+        while i != j:
+            i = hop[i, j]
+            path.append(nodes[i])
+
+        cost = dist[index[source], j].item()
+        return path, int(cost) if cost.is_integer() else cost
+
+    def distance(self, source, goal):
+        result = self.query(source, goal)
+        return None if result is None else result[1]
+
+    def path(self, source, goal):
+        result = self.query(source, goal)
+        return None if result is None else result[0]
+
+
+if __name__ == "__main__":
+    from graph import random_graph
+    from task1 import Environment
+
+    oracle = DistanceOracle(Environment())
+    for goal in ["D", "E", "F", "G", "H"]:
+        print(f"A -> {goal}:", oracle.query("A", goal))
+
+    sparse_oracle = DistanceOracle(random_graph(10_000))
+    for goal in range(1, 6):
+        print(f"0 -> {goal}:", sparse_oracle.query(0, goal))
+    print("Tree cache:", sparse_oracle.tree.cache_info())
@@ -1,27 +1,53 @@
+import heapq
+
+from task3 import depth_limited_search, iterative_deepening_search
+
+
 class Environment:
+    version = 0
+
+    neighbors = {
+        "A": ["B", "C"],
+        "B": ["D", "E"],
+        "C": ["F", "G"],
+        "D": [],
+        "E": ["H"],
+        "F": [],
+        "G": [],
+        "H": [],
+    }
+
+    neighbors_with_cost = {
+        "A": [("B", 1), ("C", 2)],
+        "B": [("D", 3), ("E", 1)],
+        "C": [("F", 4), ("G", 2)],
+        "D": [("H", 6)],
+        "E": [("H", 2)],
+        "F": [("H", 3)],
+        "G": [("H", 4)],
+        "H": [],
+    }
+
+    reverse_neighbors_with_cost = None
+
+    def get_nodes(self):
+        return list(self.neighbors_with_cost)
+
     def get_neighbors(self, state):
-        return {
-            "A": ["B", "C"],
-            "B": ["D", "E"],
-            "C": ["F", "G"],
-            "D": [],
-            "E": ["H"],
-            "F": [],
-            "G": [],
-            "H": [],
-        }[state]
+        return self.neighbors[state]
 
     def get_neighbors_with_cost(self, state):
-        return {
-            "A": [("B", 1), ("C", 2)],
-            "B": [("D", 3), ("E", 1)],
-            "C": [("F", 4), ("G", 2)],
-            "D": [("H", 6)],
-            "E": [("H", 2)],
-            "F": [("H", 3)],
-            "G": [("H", 4)],
-            "H": [],
-        }[state]
+        return self.neighbors_with_cost[state]
+
+    def get_reverse_neighbors_with_cost(self, state):
+        if self.reverse_neighbors_with_cost is None:
+            reverse = {node: [] for node in self.neighbors_with_cost}
+            for node, edges in self.neighbors_with_cost.items():
+                for neighbor, cost in edges:
+                    reverse[neighbor].append((node, cost))
+            self.reverse_neighbors_with_cost = reverse
+
+        return self.reverse_neighbors_with_cost[state]
 
 
 class DLSAgent:
@@ -29,60 +55,212 @@ class DLSAgent:
         self.env = env
 
     def depth_limited_search(self, initial, goal, limit):
-        stack = [(initial, [initial], 0)]
-        seen = set()
+        return depth_limited_search(initial, goal, limit, self.env.get_neighbors)
 
-        while stack:
-            state, path, depth = stack.pop()
+    def iterative_deepening_search(self, initial, goal, max_depth=None):
+        return iterative_deepening_search(
+            initial, goal, max_depth, self.env.get_neighbors
+        )
 
-            if state == goal:
-                return path
 
-            if depth < limit:
-                seen.add(state)
+class ShortestPathTree:
+    def __init__(self, source, parent, distance):
+        self.source = source
+        self.parent = parent
+        self.distance = distance
 
-                for neighbor in self.env.get_neighbors(state):
-                    if neighbor not in seen:
-                        stack.append((neighbor, path + [neighbor], depth + 1))
+    def path(self, goal):
+        if goal not in self.distance:
+            return None
 
-        return None
+        path = []
+        while goal is not None:
+            path.append(goal)
+            goal = self.parent[goal]
+
+        path.reverse()
+        return path
+
+    def query(self, goal):
+        if goal not in self.distance:
+            return None
+        return self.path(goal), self.distance[goal]
 
 
 class UCSAgent:
     def __init__(self, env):
         self.env = env
 
-    def uniform_cost_search(self, initial, goal):
-        seen = set()
-        queue = [(initial, 0)]
+    def shortest_path_tree(self, initial, goals=None, reverse=False):
+        if reverse:
+            expand = self.env.get_reverse_neighbors_with_cost
+        else:
+            expand = self.env.get_neighbors_with_cost
+
+        remaining = None if goals is None else set(goals)
+        queue = [(0, initial)]
         parent = {initial: None}
         node_cost = {initial: 0}
+        distance = {}
+        self.expanded = 0
+
+        while queue:
+            current_cost, state = heapq.heappop(queue)
+
+            if current_cost > node_cost[state]:
+                continue
+
+            self.expanded += 1
+            distance[state] = current_cost
+
+            if remaining is not None:
+                remaining.discard(state)
+                if not remaining:
+                    break
+
+            for neighbor, cost in expand(state):
+                new_cost = cost + current_cost
+                if neighbor not in node_cost or node_cost[neighbor] > new_cost:
+                    heapq.heappush(queue, (new_cost, neighbor))
+                    node_cost[neighbor] = new_cost
+                    parent[neighbor] = state
+
+        return ShortestPathTree(initial, parent, distance)
+
+    def uniform_cost_search(self, initial, goal):
+        return self.shortest_path_tree(initial, [goal]).query(goal)
+
+    def bidirectional_search(self, initial, goal):
+        expand = [
+            self.env.get_neighbors_with_cost,
+            self.env.get_reverse_neighbors_with_cost,
+        ]
+        queues = [[(0, initial)], [(0, goal)]]
+        parents = [{initial: None}, {goal: None}]
+        node_costs = [{initial: 0}, {goal: 0}]
+        best_cost = 0 if initial == goal else float("inf")
+        meet = initial if initial == goal else None
+        self.expanded = 0
+
+        while queues[0] and queues[1]:
+            if queues[0][0][0] + queues[1][0][0] >= best_cost:
+                break
+
+            side = 0 if len(queues[0]) <= len(queues[1]) else 1
+            queue, parent, node_cost = queues[side], parents[side], node_costs[side]
+            other_cost = node_costs[1 - side]
+
+            current_cost, state = heapq.heappop(queue)
+            if current_cost > node_cost[state]:
+                continue
+
+            self.expanded += 1
+
+            for neighbor, cost in expand[side](state):
+                new_cost = cost + current_cost
+                if neighbor not in node_cost or node_cost[neighbor] > new_cost:
+                    heapq.heappush(queue, (new_cost, neighbor))
+                    node_cost[neighbor] = new_cost
+                    parent[neighbor] = state
+
+                    if neighbor in other_cost:
+                        total = new_cost + other_cost[neighbor]
+                        if total < best_cost:
+                            best_cost = total
+                            meet = neighbor
+
+        if meet is None:
+            return None
+
+        forward = ShortestPathTree(initial, parents[0], node_costs[0]).path(meet)
+        backward = ShortestPathTree(goal, parents[1], node_costs[1]).path(meet)
+        return forward + backward[-2::-1], best_cost
+
+    def spur_search(self, spur, goal, to_goal, blocked_nodes, blocked_edges):
+        queue = [(to_goal[spur], 0, spur)]
+        parent = {spur: None}
+        node_cost = {spur: 0}
 
         while queue:
-            queue.sort(key=lambda x: x[1])
-            state, current_cost = queue.pop(0)
+            _, current_cost, state = heapq.heappop(queue)
 
-            if state in seen:
+            if current_cost > node_cost[state]:
                 continue
 
+            self.expanded += 1
+
             if state == goal:
-                path = []
-                while state:
-                    path.append(state)
+                costs = []
+                while state is not None:
+                    costs.append((state, node_cost[state]))
                     state = parent[state]
-
-                path.reverse()
-                return path, current_cost
+                costs.reverse()
+                return costs
 
             for neighbor, cost in self.env.get_neighbors_with_cost(state):
+                if (
+                    neighbor not in to_goal
+                    or neighbor in blocked_nodes
+                    or (state, neighbor) in blocked_edges
+                ):
+                    continue
+
                 new_cost = cost + current_cost
                 if neighbor not in node_cost or node_cost[neighbor] > new_cost:
-                    queue.append((neighbor, new_cost))
+                    heapq.heappush(
+                        queue, (new_cost + to_goal[neighbor], new_cost, neighbor)
+                    )
                     node_cost[neighbor] = new_cost
                     parent[neighbor] = state
 
         return None
 
+    def k_shortest_paths(self, initial, goal, k):
+        to_goal = self.shortest_path_tree(goal, reverse=True)
+        if initial not in to_goal.distance:
+            return []
+
+        first = to_goal.path(initial)[::-1]
+        total = to_goal.distance[initial]
+        shortest = [[(node, total - to_goal.distance[node]) for node in first]]
+        candidates = []
+        seen = {tuple(first)}
+        self.expanded = 0
+
+        while len(shortest) < k:
+            previous = shortest[-1]
+
+            for i in range(len(previous) - 1):
+                spur, root_cost = previous[i]
+                root = [node for node, _ in previous[: i + 1]]
+                blocked_nodes = set(root[:-1])
+                blocked_edges = {
+                    (path[i][0], path[i + 1][0])
+                    for path in shortest
+                    if len(path) > i + 1 and [node for node, _ in path[: i + 1]] == root
+                }
+
+                spur_path = self.spur_search(
+                    spur, goal, to_goal.distance, blocked_nodes, blocked_edges
+                )
+                if spur_path is None:
+                    continue
+
+                path = previous[:i] + [
+                    (node, root_cost + cost) for node, cost in spur_path
+                ]
+                key = tuple(node for node, _ in path)
+                if key not in seen:
+                    seen.add(key)
+                    heapq.heappush(candidates, (path[-1][1], key, path))
+
+            if not candidates:
+                break
+
+            shortest.append(heapq.heappop(candidates)[2])
+
+        return [([node for node, _ in path], path[-1][1]) for path in shortest]
+
 
 if __name__ == "__main__":
     env = Environment()
@@ -94,3 +272,9 @@ if __name__ == "__main__":
 
     print("DLS Path:", dls_path)
     print("UCS Path:", ucs_path)
+    print("Bidirectional UCS Path:", ucs_agent.bidirectional_search("A", "H"))
+    print("3 shortest UCS Paths:", ucs_agent.k_shortest_paths("A", "H", 3))
+
+    tree = ucs_agent.shortest_path_tree("A")
+    for goal in ["D", "F", "G", "H"]:
+        print(f"UCS Path to {goal}:", tree.query(goal))
@@ -1,4 +1,4 @@
-from copy import deepcopy
+import numpy as np
 
 
 def get_tsp_neighbors(state):
@@ -10,29 +10,124 @@ def get_tsp_neighbors(state):
     }[state]
 
 
-def find_cheapest_cycle():
-    paths = [{"path": [node], "cost": 0} for node in range(1, 5)]
-    complete_paths = []
+def distance_matrix(nodes, get_neighbors):
+    index = {node: i for i, node in enumerate(nodes)}
+    dist = np.full((len(nodes), len(nodes)), np.inf)
+    np.fill_diagonal(dist, 0)
+
+    for node in nodes:
+        for neighbor, cost in get_neighbors(node):
+            dist[index[node], index[neighbor]] = cost
+
+    return dist
+
+
+def held_karp(dist):
+    dist = np.asarray(dist, dtype=float)
+    n = len(dist)
+    if n == 1:
+        return [0, 0], 0.0
+
+    m = n - 1
+    full = 1 << m
+    inner = dist[1:, 1:]
+
+    dp = np.full((full, m), np.inf)
+    parent = np.full((full, m), -1, dtype=np.int8)
+    dp[1 << np.arange(m), np.arange(m)] = dist[0, 1:]
+
+    masks = np.arange(full)
+    popcount = np.zeros(full, dtype=np.int8)
+    for bit in range(m):
+        popcount += (masks >> bit) & 1
+
+    for size in range(2, m + 1):
+        layer = masks[popcount == size]
+        for last in range(m):
+            subsets = layer[(layer >> last) & 1 == 1]
+            cost = dp[subsets ^ (1 << last)] + inner[:, last]
+            best = cost.argmin(axis=1)
+            dp[subsets, last] = cost[np.arange(len(subsets)), best]
+            parent[subsets, last] = best
+
+    total = dp[full - 1] + dist[1:, 0]
+    last = int(total.argmin())
+    best_cost = float(total[last])
+    if best_cost == np.inf:
+        return None
+
+    tour = []
+    mask = full - 1
+    while last != -1:
+        tour.append(last + 1)
+        mask, last = mask ^ (1 << last), int(parent[mask, last])
+    tour.reverse()
 
-    while paths:
-        current = paths.pop(0)
+    return [0] + tour + [0], best_cost
 
-        if len(current["path"]) == 5:
-            complete_paths.append(current)
-            continue
 
-        for node, cost in get_tsp_neighbors(current["path"][-1]):
-            root = current["path"][0]
-            if (len(current["path"]) == 4 and node == root) or (
-                node not in current["path"]
-            ):
-                new_cost = current["cost"] + cost
-                new_path = deepcopy(current["path"]) + [node]
-                paths.append({"path": new_path, "cost": new_cost})
+def branch_and_bound(dist):
+    dist = np.asarray(dist, dtype=float)
+    n = len(dist)
+    off_diagonal = dist + np.diag(np.full(n, np.inf))
+    min_out = off_diagonal.min(axis=1)
+    if n == 1:
+        return [0, 0], 0.0
+    if np.isinf(min_out).any():
+        return None
+    order = [list(np.argsort(row)) for row in off_diagonal]
 
-    best_path = min(complete_paths, key=lambda x: x["cost"])
+    best = {"path": None, "cost": np.inf}
+    path = [0]
+    visited = [False] * n
+    visited[0] = True
 
-    return best_path
+    def search(current, cost, remaining_bound):
+        if len(path) == n:
+            total = cost + dist[current, 0]
+            if total < best["cost"]:
+                best["cost"] = total
+                best["path"] = path + [0]
+            return
+
+        for node in order[current]:
+            if visited[node] or node == current:
+                continue
+
+            new_cost = cost + dist[current, node]
+            bound = new_cost + remaining_bound
+            if bound >= best["cost"]:
+                continue
+
+            visited[node] = True
+            path.append(node)
+            search(node, new_cost, remaining_bound - min_out[node])
+            path.pop()
+            visited[node] = False
+
+    search(0, 0.0, min_out.sum() - min_out[0])
+
+    if best["path"] is None:
+        return None
+    return [int(node) for node in best["path"]], float(best["cost"])
+
+
+def solve_tsp(dist, max_exact=22):
+    if len(dist) <= max_exact:
+        return held_karp(dist)
+    return branch_and_bound(dist)
+
+
+def find_cheapest_cycle():
+    nodes = [1, 2, 3, 4]
+    result = solve_tsp(distance_matrix(nodes, get_tsp_neighbors))
+    if result is None:
+        return None
+    tour, cost = result
+    return {
+        "path": [nodes[i] for i in tour],
+        "cost": int(cost) if cost.is_integer() else cost,
+    }
 
 
 if __name__ == "__main__":
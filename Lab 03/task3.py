@@ -1,44 +1,94 @@
+import time
+
+graph = {
+    "A": ["B", "C"],
+    "B": ["D", "E"],
+    "C": ["F", "G"],
+    "D": [],
+    "E": ["H"],
+    "F": [],
+    "G": [],
+    "H": [],
+}
+
+
 def get_neighbors(state):
-    return {
-        "A": ["B", "C"],
-        "B": ["D", "E"],
-        "C": ["F", "G"],
-        "D": [],
-        "E": ["H"],
-        "F": [],
-        "G": [],
-        "H": [],
-    }[state]
-
-
-def depth_limited_search(initial, goal, limit):
-    stack = [(initial, [initial], 0)]
-    seen = set()
+    return graph[state]
+
+
+def depth_limited_search(initial, goal, limit, get_neighbors=get_neighbors, stats=None):
+    if stats is None:
+        stats = {}
+    stats["generated"] = 0
+    stats["cutoffs"] = 0
+
+    path = []
+    on_path = set()
+    stack = [iter([initial])]
 
     while stack:
-        state, path, depth = stack.pop()
+        state = next(stack[-1], None)
 
-        if state == goal:
-            return path
+        if state is None:
+            stack.pop()
+            if path:
+                on_path.discard(path.pop())
+            continue
+
+        if state in on_path:
+            continue
 
-        if depth < limit:
-            seen.add(state)
+        stats["generated"] += 1
+        path.append(state)
+        on_path.add(state)
+
+        if state == goal:
+            return list(path)
 
-            for neighbor in get_neighbors(state):
-                if neighbor not in seen:
-                    stack.append((neighbor, path + [neighbor], depth + 1))
+        if len(path) <= limit:
+            stack.append(iter(get_neighbors(state)))
+        else:
+            if any(neighbor not in on_path for neighbor in get_neighbors(state)):
+                stats["cutoffs"] += 1
+            on_path.discard(path.pop())
 
     return None
 
 
-def iterative_depth_limited_search(initial, goal):
-    for i in range(1, 5):
-        result = depth_limited_search(initial, goal, i)
-        if result:
-            print(f"Found path to target at depth {i}: {result}")
-            break
-        else:
-            print(f"Failed to find path at depth {i}")
+def iterative_deepening_search(
+    initial, goal, max_depth=None, get_neighbors=get_neighbors
+):
+    history = []
+    depth = 0
+
+    while max_depth is None or depth <= max_depth:
+        stats = {"depth": depth}
+        start = time.perf_counter()
+        path = depth_limited_search(initial, goal, depth, get_neighbors, stats)
+        stats["time"] = time.perf_counter() - start
+        history.append(stats)
+
+        if path is not None or stats["cutoffs"] == 0:
+            return path, history
+
+        depth += 1
+
+    return None, history
+
+
+def iterative_depth_limited_search(initial, goal, max_depth=None):
+    path, history = iterative_deepening_search(initial, goal, max_depth)
+
+    for stats in history:
+        print(
+            f"Depth {stats['depth']}: generated {stats['generated']} nodes, "
+            f"{stats['cutoffs']} cutoffs in {stats['time'] * 1000:.3f}ms"
+        )
+
+    if path:
+        print(f"Found path to target at depth {len(path) - 1}: {path}")
+    else:
+        print(f"Failed to find path within depth {history[-1]['depth']}")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,7 @@
+from collections import deque
+
+import numpy as np
+
 grid = [
     ["S", 0, 1, 0, 0, 0],
     [0, 1, 1, 0, 1, 0],
@@ -7,53 +11,210 @@ grid = [
     [0, 1, 0, 0, 0, "G"],
 ]
 
+START = 5
+
+
+def load_grid(filename):
+    if filename.endswith(".npy"):
+        return np.load(filename, mmap_mode="r")
+
+    with open(filename, "rb") as f:
+        data = f.read()
+
+    header = []
+    pos = 0
+    while len(header) < 4:
+        while data[pos : pos + 1].isspace():
+            pos += 1
+        if data[pos : pos + 1] == b"#":
+            pos = data.index(b"\n", pos)
+            continue
+        end = pos
+        while not data[end : end + 1].isspace():
+            end += 1
+        header.append(data[pos:end])
+        pos = end
+
+    magic, w, h, maxval = header[0], int(header[1]), int(header[2]), int(header[3])
+    if magic == b"P5":
+        dtype = np.uint8 if maxval < 256 else np.dtype(">u2")
+        pixels = np.frombuffer(data, dtype=dtype, count=w * h, offset=pos + 1)
+    elif magic == b"P2":
+        pixels = np.array(data[pos:].split()[: w * h], dtype=np.int64)
+    else:
+        raise ValueError(f"Unsupported PGM format: {magic!r}")
+
+    return (pixels.reshape(h, w) < (maxval + 1) // 2).astype(np.uint8)
+
+
+def occupancy(grid):
+    if isinstance(grid, np.ndarray):
+        h, w = grid.shape
+        blocked = np.ascontiguousarray(grid != 0, dtype=np.uint8)
+        return memoryview(blocked).cast("B"), h, w
+
+    h, w = len(grid), len(grid[0])
+    blocked = bytearray(1 if cell == 1 else 0 for row in grid for cell in row)
+    return blocked, h, w
+
 
-def path_finder(start):
-    w = len(grid[0])
-    h = len(grid)
+def find_cell(grid, value):
+    for i, row in enumerate(grid):
+        for j, cell in enumerate(row):
+            if cell == value:
+                return i, j
+    return None
 
-    seen = set()
-    queue = [start]
-    parent = {start: None}
+
+def neighbors(idx, w, n):
+    if idx + w < n:
+        yield 1, idx + w
+    if idx >= w:
+        yield 2, idx - w
+    if idx % w != w - 1:
+        yield 3, idx + 1
+    if idx % w != 0:
+        yield 4, idx - 1
+
+
+def trace(came_from, w, idx):
+    steps = (0, w, -w, 1, -1)
+    path = []
+    while came_from[idx] != START:
+        path.append(divmod(idx, w))
+        idx -= steps[came_from[idx]]
+    path.append(divmod(idx, w))
+    path.reverse()
+    return path
+
+
+def bfs(blocked, w, start, goal):
+    n = len(blocked)
+    came_from = bytearray(n)
+    came_from[start] = START
+    queue = deque([start])
 
     while queue:
-        state = queue.pop(0)
-        seen.add(state)
-        i, j = state
-
-        if grid[i][j] == "G":
-            path = []
-            while state:
-                path.append(state)
-                state = parent[state]
-            path.reverse()
-            print("Path to goal:", path)
-            return
-
-        if i + 1 < h and grid[i + 1][j] != 1:
-            new_state = i + 1, j
-            if new_state not in seen:
-                queue.append(new_state)
-                parent[new_state] = state
-
-        if i - 1 >= 0 and grid[i - 1][j] != 1:
-            new_state = i - 1, j
-            if new_state not in seen:
-                queue.append(new_state)
-                parent[new_state] = state
-
-        if j + 1 < w and grid[i][j + 1] != 1:
-            new_state = i, j + 1
-            if new_state not in seen:
-                queue.append(new_state)
-                parent[new_state] = state
-
-        if j - 1 >= 0 and grid[i][j - 1] != 1:
-            new_state = i, j - 1
-            if new_state not in seen:
-                queue.append(new_state)
-                parent[new_state] = state
+        idx = queue.popleft()
+
+        if idx == goal:
+            return trace(came_from, w, idx)
+
+        for move, new_idx in neighbors(idx, w, n):
+            if not blocked[new_idx] and not came_from[new_idx]:
+                came_from[new_idx] = move
+                queue.append(new_idx)
+
+    return None
+
+
+def expand_layer(queue, came_from, other, blocked, w):
+    n = len(blocked)
+    for _ in range(len(queue)):
+        idx = queue.popleft()
+
+        for move, new_idx in neighbors(idx, w, n):
+            if not blocked[new_idx] and not came_from[new_idx]:
+                came_from[new_idx] = move
+                if other[new_idx]:
+                    return new_idx
+                queue.append(new_idx)
+
+    return None
+
+
+def bidirectional_bfs(blocked, w, start, goal):
+    n = len(blocked)
+    forward, backward = bytearray(n), bytearray(n)
+    forward[start] = backward[goal] = START
+    forward_queue, backward_queue = deque([start]), deque([goal])
+
+    if start == goal:
+        return [divmod(start, w)]
+
+    while forward_queue and backward_queue:
+        if len(forward_queue) <= len(backward_queue):
+            meet = expand_layer(forward_queue, forward, backward, blocked, w)
+        else:
+            meet = expand_layer(backward_queue, backward, forward, blocked, w)
+
+        if meet is not None:
+            return trace(forward, w, meet) + trace(backward, w, meet)[-2::-1]
+
+    return None
+
+
+def path_finder(start, goal=None, grid=grid, bidirectional=False):
+    if goal is None:
+        if isinstance(grid, np.ndarray):
+            raise ValueError("goal is required for array grids")
+        goal = find_cell(grid, "G")
+        if goal is None:
+            raise ValueError("grid has no 'G' cell")
+
+    blocked, h, w = occupancy(grid)
+    if blocked[start[0] * w + start[1]] or blocked[goal[0] * w + goal[1]]:
+        return None
+
+    search = bidirectional_bfs if bidirectional else bfs
+    return search(blocked, w, start[0] * w + start[1], goal[0] * w + goal[1])
+
+
+def distance_field(start, grid=grid):
+    if isinstance(grid, np.ndarray):
+        free = grid == 0
+    else:
+        free = np.array([[cell != 1 for cell in row] for row in grid])
+
+    h, w = free.shape
+    dist = np.full(h * w, -1, dtype=np.int32)
+    came_from = np.zeros(h * w, dtype=np.uint8)
+    unvisited = free.ravel().copy()
+
+    frontier = np.array([start[0] * w + start[1]])
+    if unvisited[frontier[0]]:
+        unvisited[frontier] = False
+        dist[frontier] = 0
+        came_from[frontier] = START
+    else:
+        frontier = frontier[:0]
+
+    depth = 0
+    while len(frontier):
+        depth += 1
+        col = frontier % w
+        moves = (
+            (1, frontier[frontier < (h - 1) * w] + w),
+            (2, frontier[frontier >= w] - w),
+            (3, frontier[col != w - 1] + 1),
+            (4, frontier[col != 0] - 1),
+        )
+
+        reached = []
+        for move, candidates in moves:
+            candidates = candidates[unvisited[candidates]]
+            unvisited[candidates] = False
+            came_from[candidates] = move
+            reached.append(candidates)
+
+        frontier = np.concatenate(reached)
+        dist[frontier] = depth
+
+    return dist.reshape(h, w), came_from.reshape(h, w)
+
+
+def path_from_field(came_from, goal):
+    if not came_from[goal]:
+        return None
+    w = came_from.shape[1]
+    return trace(came_from.ravel(), w, goal[0] * w + goal[1])
 
 
 if __name__ == "__main__":
-    path_finder((0, 0))
+    print("Path to goal:", path_finder((0, 0)))
+    print("Bidirectional path to goal:", path_finder((0, 0), bidirectional=True))
+
+    dist, came_from = distance_field((0, 0))
+    print("Distance field from start:")
+    print(dist)
+    print("Path from field:", path_from_field(came_from, (5, 5)))
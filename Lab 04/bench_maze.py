@@ -0,0 +1,57 @@
+import random
+import time
+
+from hpa import HierarchicalMaze
+from jps import a_star_grid, jump_point_search, path_cost
+from task1 import best_first_search
+
+
+def random_maze(rows, cols, density=0.25, seed=0):
+    rng = random.Random(seed)
+    maze = [
+        [1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)
+    ]
+    maze[0][0] = maze[rows - 1][cols - 1] = 0
+    return maze
+
+
+def timed(search, *args, **kwargs):
+    start = time.perf_counter()
+    result = search(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    size = 1000
+    maze = random_maze(size, size)
+    start, end = (0, 0), (size - 1, size - 1)
+
+    for mode in ["greedy", "astar", "idastar"]:
+        path, elapsed = timed(best_first_search, maze, start, end, mode)
+        length = len(path) - 1 if path else None
+        print(f"{mode:>7}: path length {length} in {elapsed:.3f}s")
+
+    for name, density in [("open", 0.0), ("cluttered", 0.25)]:
+        maze = random_maze(size, size, density)
+        for diagonal in [False, True]:
+            for search in [a_star_grid, jump_point_search]:
+                stats = {}
+                path, elapsed = timed(search, maze, start, end, diagonal, stats)
+                cost = f"{path_cost(path):.1f}" if path else None
+                print(
+                    f"{name:>9} {'8' if diagonal else '4'}-connected "
+                    f"{search.__name__:>17}: cost {cost}, "
+                    f"{stats['expanded']} expanded in {elapsed:.3f}s"
+                )
+
+    maze = random_maze(size, size)
+    hierarchy = HierarchicalMaze(maze)
+    _, elapsed = timed(hierarchy.build)
+    print(f"hpa build: {len(hierarchy.graphs)} sectors in {elapsed:.3f}s")
+    path, elapsed = timed(hierarchy.query, start, end)
+    print(f"    hpa: path length {len(path) - 1} in {elapsed:.3f}s")
+    path, elapsed = timed(best_first_search, maze, start, end, "astar")
+    print(f"  astar: path length {len(path) - 1} in {elapsed:.3f}s")
+    _, elapsed = timed(hierarchy.update, [((size // 2, size // 2), 1)])
+    path, requery = timed(hierarchy.query, start, end)
+    print(f"hpa update {elapsed:.4f}s, query after update {requery:.3f}s")
@@ -0,0 +1,64 @@
+import hashlib
+from collections import OrderedDict
+
+
+def maze_digest(maze):
+    if hasattr(maze, "tobytes"):
+        shape, data = maze.shape, maze.tobytes()
+    else:
+        shape, data = (len(maze), len(maze[0])), b"".join(bytes(row) for row in maze)
+    return hashlib.blake2b(repr(shape).encode() + data, digest_size=16).digest()
+
+
+class PathCache:
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.digests = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def key(self, maze, start, end):
+        digest = maze_digest(maze)
+        previous = self.digests.get(id(maze))
+        if previous is not None and previous != digest:
+            self.invalidate(previous)
+        self.digests[id(maze)] = digest
+        return digest, start, end
+
+    def lookup(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, self.entries[key]
+
+        self.misses += 1
+        return False, None
+
+    def store(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, digest):
+        stale = [key for key in self.entries if key[0] == digest]
+        for key in stale:
+            del self.entries[key]
+        self.invalidations += len(stale)
+
+    def clear(self):
+        self.entries.clear()
+        self.digests.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "size": len(self.entries),
+        }
+
+
+path_cache = PathCache()
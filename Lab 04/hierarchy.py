@@ -0,0 +1,268 @@
+import numpy as np
+
+INF = float("inf")
+
+
+def bfs_levels(adjacency, nodes, source):
+    levels = {source: 0}
+    frontier = [source]
+    while frontier:
+        next_frontier = []
+        for node in frontier:
+            for neighbor in adjacency[node]:
+                if neighbor in nodes and neighbor not in levels:
+                    levels[neighbor] = levels[node] + 1
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return levels
+
+
+def dissection_order(adjacency, nodes, leaf_size=8):
+    if len(nodes) <= leaf_size:
+        return sorted(nodes, key=lambda node: len(adjacency[node] & nodes))
+
+    levels = bfs_levels(adjacency, nodes, next(iter(nodes)))
+    if len(levels) < len(nodes):
+        component = set(levels)
+        return dissection_order(adjacency, component, leaf_size) + dissection_order(
+            adjacency, nodes - component, leaf_size
+        )
+
+    # Layer from both ends of a double sweep and keep the smallest balanced
+    # cut; layer nodes with no neighbour further out can join the near side.
+    best = None
+    for _ in range(2):
+        levels = bfs_levels(adjacency, nodes, max(levels, key=levels.get))
+        layers = [[] for _ in range(max(levels.values()) + 1)]
+        for node, level in levels.items():
+            layers[level].append(node)
+
+        below = len(layers[0])
+        for level, layer in enumerate(layers[1:], 1):
+            separator = [
+                node
+                for node in layer
+                if any(levels.get(other, -1) > level for other in adjacency[node])
+            ]
+            balanced = 3 * below >= len(nodes) and 3 * (below + len(layer)) <= 2 * len(
+                nodes
+            )
+            key = (not balanced, len(separator))
+            if separator and (best is None or key < best[0]):
+                best = key, level, levels, separator
+            below += len(layer)
+
+    if best is None:
+        return sorted(nodes, key=lambda node: len(adjacency[node] & nodes))
+
+    _, middle, levels, separator = best
+    right = {node for node, level in levels.items() if level > middle}
+    left = nodes - right - set(separator)
+
+    return (
+        dissection_order(adjacency, left, leaf_size)
+        + dissection_order(adjacency, right, leaf_size)
+        + separator
+    )
+
+
+class ContractionHierarchy:
+    def __init__(self, graph):
+        self.order = []
+        self.rank = {}
+        self.up = {}
+        self.ancestor = {}
+        self.contract(graph)
+        self.customize(graph)
+
+    def contract(self, graph):
+        adjacency = {node: set() for node in graph}
+        for node, edges in graph.items():
+            for neighbor in edges:
+                if neighbor != node:
+                    adjacency[node].add(neighbor)
+                    adjacency.setdefault(neighbor, set()).add(node)
+
+        self.order = dissection_order(adjacency, set(adjacency))
+        self.rank = {node: i for i, node in enumerate(self.order)}
+
+        for node in self.order:
+            neighbors = adjacency.pop(node)
+            self.up[node] = sorted(neighbors, key=self.rank.get)
+            self.ancestor[node] = self.up[node][0] if neighbors else None
+            for neighbor in neighbors:
+                adjacency[neighbor].discard(node)
+                adjacency[neighbor] |= neighbors - {neighbor}
+
+        # Arc ids only depend on the topology, so every lower triangle is
+        # resolved here once and customize() just gathers and scatters weights.
+        self.arcs = [(node, v) for node in self.order for v in self.up[node]]
+        self.arc_id = {arc: i for i, arc in enumerate(self.arcs)}
+        self.heads = np.array([self.rank[v] for _, v in self.arcs], dtype=np.int64)
+        self.up_arcs = {}
+        self.triangles = {}
+        for node in self.order:
+            upper = self.up[node]
+            self.up_arcs[node] = np.array(
+                [self.arc_id[node, v] for v in upper], dtype=np.int64
+            )
+            self.triangles[node] = np.array(
+                [
+                    self.arc_id[u, v]
+                    for i, u in enumerate(upper)
+                    for v in upper[i + 1 :]
+                ],
+                dtype=np.int64,
+            )
+
+    def customize(self, graph):
+        # upward[a] is the cost along arc a towards its higher endpoint and
+        # downward[a] the reverse; the middle arrays keep the rank of the node
+        # a shortcut runs through, or -1 for an original edge.
+        upward = np.array(
+            [graph.get(u, {}).get(v, INF) for u, v in self.arcs], dtype=float
+        )
+        downward = np.array(
+            [graph.get(v, {}).get(u, INF) for u, v in self.arcs], dtype=float
+        )
+        middle_up = np.full(len(self.arcs), -1, dtype=np.int64)
+        middle_down = np.full(len(self.arcs), -1, dtype=np.int64)
+
+        pairs = {}
+        for node in self.order:
+            if len(self.up[node]) < 2:
+                continue
+            arcs, triangles = self.up_arcs[node], self.triangles[node]
+            pair = pairs.setdefault(len(arcs), np.triu_indices(len(arcs), 1))
+            out, into = upward[arcs], downward[arcs]
+
+            cost = (into[:, None] + out[None, :])[pair]
+            better = cost < upward[triangles]
+            upward[triangles[better]] = cost[better]
+            middle_up[triangles[better]] = self.rank[node]
+
+            cost = (out[:, None] + into[None, :])[pair]
+            better = cost < downward[triangles]
+            downward[triangles[better]] = cost[better]
+            middle_down[triangles[better]] = self.rank[node]
+
+        basic_up, basic_down = upward.copy(), downward.copy()
+        for node in reversed(self.order):
+            if not self.up[node]:
+                continue
+            arcs, triangles = self.up_arcs[node], self.triangles[node]
+            pair = pairs.setdefault(len(arcs), np.triu_indices(len(arcs), 1))
+            between = np.zeros((len(arcs), len(arcs)))
+            between[pair] = upward[triangles]
+            between[pair[::-1]] = downward[triangles]
+            span = np.arange(len(arcs))
+
+            paths = upward[arcs][:, None] + between
+            via = paths.argmin(axis=0)
+            better = paths[via, span] < upward[arcs]
+            upward[arcs[better]] = paths[via, span][better]
+            middle_up[arcs[better]] = self.heads[arcs[via[better]]]
+
+            paths = between + downward[arcs][None, :]
+            via = paths.argmin(axis=1)
+            better = paths[span, via] < downward[arcs]
+            downward[arcs[better]] = paths[span, via][better]
+            middle_down[arcs[better]] = self.heads[arcs[via[better]]]
+
+        keep_up = (upward < INF) & (upward == basic_up)
+        keep_down = (downward < INF) & (downward == basic_down)
+
+        self.middle_up = middle_up.tolist()
+        self.middle_down = middle_down.tolist()
+        self.forward = {}
+        self.backward = {}
+        for node in self.order:
+            arcs = self.up_arcs[node]
+            self.forward[node] = [
+                (v, cost)
+                for v, cost, keep in zip(
+                    self.up[node], upward[arcs].tolist(), keep_up[arcs].tolist()
+                )
+                if keep
+            ]
+            self.backward[node] = [
+                (v, cost)
+                for v, cost, keep in zip(
+                    self.up[node], downward[arcs].tolist(), keep_down[arcs].tolist()
+                )
+                if keep
+            ]
+
+    def unpack(self, u, v):
+        if self.rank[u] < self.rank[v]:
+            middle = self.middle_up[self.arc_id[u, v]]
+        else:
+            middle = self.middle_down[self.arc_id[v, u]]
+        if middle < 0:
+            return [u, v]
+
+        node = self.order[middle]
+        return self.unpack(u, node)[:-1] + self.unpack(node, v)
+
+    def query(self, start, goal):
+        dist = [{start: 0}, {goal: 0}]
+        parent = [{start: None}, {goal: None}]
+
+        # Upward paths only reach elimination-tree ancestors, so each side
+        # sweeps its ancestor chain in rank order instead of using a heap.
+        for side, node in ((0, start), (1, goal)):
+            edges = self.forward if side == 0 else self.backward
+            while node is not None:
+                cost = dist[side].get(node)
+                if cost is not None:
+                    for neighbor, edge_cost in edges[node]:
+                        new_cost = cost + edge_cost
+                        if new_cost < dist[side].get(neighbor, INF):
+                            dist[side][neighbor] = new_cost
+                            parent[side][neighbor] = node
+                node = self.ancestor[node]
+
+        meet = min(
+            (node for node in dist[0] if node in dist[1]),
+            key=lambda node: dist[0][node] + dist[1][node],
+            default=None,
+        )
+        if meet is None:
+            return None
+        best = dist[0][meet] + dist[1][meet]
+
+        path = [meet]
+        node = meet
+        while parent[0][node] is not None:
+            path = self.unpack(parent[0][node], node)[:-1] + path
+            node = parent[0][node]
+
+        node = meet
+        while parent[1][node] is not None:
+            path = path + self.unpack(node, parent[1][node])[1:]
+            node = parent[1][node]
+
+        return path, best
+
+
+if __name__ == "__main__":
+    from task4 import apply_traffic
+
+    graph = {
+        "A": {"B": 4, "C": 2},
+        "B": {"A": 4, "D": 5, "E": 10},
+        "C": {"A": 2, "E": 8},
+        "D": {"B": 5, "F": 6},
+        "E": {"B": 10, "C": 8, "F": 3},
+        "F": {"D": 6, "E": 3, "G": 2},
+        "G": {"F": 2},
+    }
+
+    hierarchy = ContractionHierarchy(graph)
+    print("Contraction order:", hierarchy.order)
+    print("Route A -> G:", hierarchy.query("A", "G"))
+
+    for node in graph:
+        apply_traffic(graph, node)
+    hierarchy.customize(graph)
+    print("Route A -> G after traffic update:", hierarchy.query("A", "G"))
@@ -0,0 +1,232 @@
+import heapq
+from collections import deque
+from itertools import count
+
+from task1 import heuristic
+
+
+class HierarchicalMaze:
+    def __init__(self, maze, size=32, max_run=6):
+        self.maze = maze
+        self.size = size
+        self.max_run = max_run
+        self.rows, self.cols = len(maze), len(maze[0])
+        self.shape = (-(-self.rows // size), -(-self.cols // size))
+        self.borders = {}
+        self.graphs = {}
+
+    def sector(self, position):
+        return position[0] // self.size, position[1] // self.size
+
+    def bounds(self, sector):
+        x0, y0 = sector[0] * self.size, sector[1] * self.size
+        return x0, y0, min(x0 + self.size, self.rows), min(y0 + self.size, self.cols)
+
+    def adjacent_sectors(self, sector):
+        sx, sy = sector
+        for nx, ny in [(sx + 1, sy), (sx - 1, sy), (sx, sy + 1), (sx, sy - 1)]:
+            if 0 <= nx < self.shape[0] and 0 <= ny < self.shape[1]:
+                yield nx, ny
+
+    def border(self, first, second):
+        key = (first, second) if first < second else (second, first)
+        if key in self.borders:
+            return self.borders[key]
+
+        low, high = key
+        x0, y0, x1, y1 = self.bounds(low)
+        if high[0] > low[0]:
+            pairs = [((x1 - 1, y), (x1, y)) for y in range(y0, y1)]
+        else:
+            pairs = [((x, y1 - 1), (x, y1)) for x in range(x0, x1)]
+
+        maze = self.maze
+        transitions = []
+        run = []
+        for a, b in pairs + [(None, None)]:
+            if a is not None and maze[a[0]][a[1]] == 0 and maze[b[0]][b[1]] == 0:
+                run.append((a, b))
+                continue
+            if len(run) >= self.max_run:
+                transitions += [run[0], run[-1]]
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+
+        self.borders[key] = transitions
+        return transitions
+
+    def search(self, sector, source, goal=None):
+        x0, y0, x1, y1 = self.bounds(sector)
+        maze = self.maze
+        distance = {source: 0}
+        came_from = {source: None}
+        queue = deque([source])
+
+        while queue:
+            current_pos = queue.popleft()
+            if current_pos == goal:
+                break
+            x, y = current_pos
+            for new_pos in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
+                nx, ny = new_pos
+                if (
+                    x0 <= nx < x1
+                    and y0 <= ny < y1
+                    and maze[nx][ny] == 0
+                    and new_pos not in distance
+                ):
+                    distance[new_pos] = distance[current_pos] + 1
+                    came_from[new_pos] = current_pos
+                    queue.append(new_pos)
+
+        return distance, came_from
+
+    def graph(self, sector):
+        if sector in self.graphs:
+            return self.graphs[sector]
+
+        links = {}
+        for neighbor in self.adjacent_sectors(sector):
+            for a, b in self.border(sector, neighbor):
+                if self.sector(a) != sector:
+                    a, b = b, a
+                links.setdefault(a, {})[b] = 1
+
+        x0, y0, x1, y1 = self.bounds(sector)
+        width = y1 - y0
+        free = [cell == 0 for row in self.maze[x0:x1] for cell in row[y0:y1]]
+        adjacency = []
+        for index, passable in enumerate(free):
+            column = index % width
+            adjacency.append(
+                [
+                    other
+                    for other, ok in [
+                        (index - width, passable),
+                        (index + width, passable),
+                        (index - 1, passable and column > 0),
+                        (index + 1, passable and column < width - 1),
+                    ]
+                    if ok and 0 <= other < len(free) and free[other]
+                ]
+            )
+
+        entrances = list(links)
+        local = [(x - x0) * width + (y - y0) for x, y in entrances]
+        graph = {}
+        for entrance, source in zip(entrances, local):
+            distance = [-1] * len(free)
+            distance[source] = 0
+            queue = [source]
+            for current in queue:
+                for other in adjacency[current]:
+                    if distance[other] < 0:
+                        distance[other] = distance[current] + 1
+                        queue.append(other)
+
+            edges = {
+                other: distance[target]
+                for other, target in zip(entrances, local)
+                if other != entrance and distance[target] >= 0
+            }
+            edges.update(links[entrance])
+            graph[entrance] = edges
+
+        self.graphs[sector] = graph
+        return graph
+
+    def build(self):
+        for sx in range(self.shape[0]):
+            for sy in range(self.shape[1]):
+                self.graph((sx, sy))
+
+    def update(self, changes):
+        touched = set()
+        for (x, y), value in changes:
+            self.maze[x][y] = value
+            touched.add(self.sector((x, y)))
+
+        for sector in touched:
+            for neighbor in self.adjacent_sectors(sector):
+                key = (sector, neighbor) if sector < neighbor else (neighbor, sector)
+                self.borders.pop(key, None)
+                self.graphs.pop(neighbor, None)
+            self.graphs.pop(sector, None)
+
+    def endpoint_edges(self, position):
+        sector = self.sector(position)
+        distance, _ = self.search(sector, position)
+        return {
+            entrance: distance[entrance]
+            for entrance in self.graph(sector)
+            if entrance in distance
+        }
+
+    def refine(self, waypoints):
+        path = [waypoints[0]]
+        for u, v in zip(waypoints, waypoints[1:]):
+            if u == v:
+                continue
+            if heuristic(u, v) == 1:
+                path.append(v)
+                continue
+            _, came_from = self.search(self.sector(u), u, v)
+            segment = []
+            while v is not None:
+                segment.append(v)
+                v = came_from[v]
+            path += segment[-2::-1]
+        return path
+
+    def query(self, start, end, stats=None):
+        maze = self.maze
+        if maze[start[0]][start[1]] or maze[end[0]][end[1]]:
+            return None
+
+        start_edges = self.endpoint_edges(start)
+        end_edges = self.endpoint_edges(end)
+        if self.sector(start) == self.sector(end):
+            distance, _ = self.search(self.sector(start), start, end)
+            if end in distance:
+                start_edges[end] = distance[end]
+
+        counter = count()
+        frontier = [(heuristic(start, end), 0, next(counter), start)]
+        came_from = {start: None}
+        best_g = {start: 0}
+        expanded = 0
+
+        while frontier:
+            _, g, _, current_pos = heapq.heappop(frontier)
+            if g > best_g[current_pos]:
+                continue
+
+            expanded += 1
+            if current_pos == end:
+                if stats is not None:
+                    stats["expanded"] = expanded
+                    stats["cost"] = g
+                waypoints = []
+                while current_pos is not None:
+                    waypoints.append(current_pos)
+                    current_pos = came_from[current_pos]
+                return self.refine(waypoints[::-1])
+
+            edges = dict(self.graph(self.sector(current_pos)).get(current_pos, {}))
+            if current_pos == start:
+                edges.update(start_edges)
+            if current_pos in end_edges:
+                edges[end] = end_edges[current_pos]
+
+            for new_pos, cost in edges.items():
+                new_g = g + cost
+                if new_pos not in best_g or new_g < best_g[new_pos]:
+                    best_g[new_pos] = new_g
+                    came_from[new_pos] = current_pos
+                    priority = new_g + heuristic(new_pos, end)
+                    heapq.heappush(frontier, (priority, new_g, next(counter), new_pos))
+
+        if stats is not None:
+            stats["expanded"] = expanded
+        return None
@@ -0,0 +1,237 @@
+import heapq
+from itertools import count
+from math import sqrt
+
+SQRT2 = sqrt(2)
+
+
+def octile(current_pos, end_pos):
+    dx = abs(current_pos[0] - end_pos[0])
+    dy = abs(current_pos[1] - end_pos[1])
+    return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+
+def manhattan(current_pos, end_pos):
+    return abs(current_pos[0] - end_pos[0]) + abs(current_pos[1] - end_pos[1])
+
+
+class Grid:
+    def __init__(self, maze):
+        self.rows, self.cols = len(maze), len(maze[0])
+        self.width = self.cols + 2
+        self.cells = bytearray(self.width * (self.rows + 2))
+        for x, row in enumerate(maze):
+            offset = (x + 1) * self.width + 1
+            self.cells[offset : offset + self.cols] = bytes(cell == 0 for cell in row)
+
+    def index(self, position):
+        return (position[0] + 1) * self.width + position[1] + 1
+
+    def position(self, index):
+        x, y = divmod(index, self.width)
+        return x - 1, y - 1
+
+
+def jump_straight(grid, index, dx, dy, end, diagonal):
+    cells, width = grid.cells, grid.width
+    step = dx * width + dy
+    while True:
+        index += step
+        if not cells[index]:
+            return None
+        if index == end:
+            return index
+
+        if dy:
+            if (cells[index + width] and not cells[index + width - dy]) or (
+                cells[index - width] and not cells[index - width - dy]
+            ):
+                return index
+        elif diagonal:
+            if (cells[index + 1] and not cells[index + 1 - step]) or (
+                cells[index - 1] and not cells[index - 1 - step]
+            ):
+                return index
+        elif (
+            jump_straight(grid, index, 0, 1, end, False) is not None
+            or jump_straight(grid, index, 0, -1, end, False) is not None
+        ):
+            return index
+
+
+def jump_diagonal(grid, index, dx, dy, end):
+    cells, width = grid.cells, grid.width
+    while True:
+        if not (cells[index + dx * width] and cells[index + dy]):
+            return None
+        index += dx * width + dy
+        if not cells[index]:
+            return None
+        if index == end:
+            return index
+        if (
+            jump_straight(grid, index, dx, 0, end, True) is not None
+            or jump_straight(grid, index, 0, dy, end, True) is not None
+        ):
+            return index
+
+
+def directions(grid, position, parent, diagonal):
+    if parent is None:
+        moves = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+        if diagonal:
+            moves += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+        return moves
+
+    x, y = position
+    dx = (x > parent[0]) - (x < parent[0])
+    dy = (y > parent[1]) - (y < parent[1])
+    cells, width = grid.cells, grid.width
+    index = grid.index(position)
+
+    def free(a, b):
+        return cells[index + a * width + b]
+
+    if dx and dy:
+        moves = [(dx, 0), (0, dy)]
+        if free(dx, 0) and free(0, dy):
+            moves.append((dx, dy))
+        return moves
+
+    if not diagonal:
+        if dx:
+            return [(dx, 0), (0, 1), (0, -1)]
+        return [(0, dy)] + [
+            (side, 0) for side in (1, -1) if free(side, 0) and not free(side, -dy)
+        ]
+
+    moves = []
+    if dx:
+        if free(dx, 0):
+            moves.append((dx, 0))
+            moves += [(dx, side) for side in (1, -1) if free(0, side)]
+        moves += [(0, side) for side in (1, -1) if free(0, side)]
+    else:
+        if free(0, dy):
+            moves.append((0, dy))
+            moves += [(side, dy) for side in (1, -1) if free(side, 0)]
+        moves += [(side, 0) for side in (1, -1) if free(side, 0)]
+    return moves
+
+
+def expand_path(jump_points):
+    path = [jump_points[0]]
+    for x, y in jump_points[1:]:
+        px, py = path[-1]
+        dx = (x > px) - (x < px)
+        dy = (y > py) - (y < py)
+        while (px, py) != (x, y):
+            px, py = px + dx, py + dy
+            path.append((px, py))
+    return path
+
+
+def jump_point_search(maze, start, end, diagonal=False, stats=None):
+    grid = Grid(maze)
+    end_index = grid.index(end)
+    heuristic = octile if diagonal else manhattan
+    counter = count()
+    h = heuristic(start, end)
+    frontier = [(h, h, next(counter), 0, start)]
+    came_from = {start: None}
+    best_g = {start: 0}
+    expanded = 0
+
+    while frontier:
+        _, _, _, g, current_pos = heapq.heappop(frontier)
+        if g > best_g[current_pos]:
+            continue
+
+        expanded += 1
+        if current_pos == end:
+            if stats is not None:
+                stats["expanded"] = expanded
+            jump_points = []
+            while current_pos is not None:
+                jump_points.append(current_pos)
+                current_pos = came_from[current_pos]
+            return expand_path(jump_points[::-1])
+
+        index = grid.index(current_pos)
+        for dx, dy in directions(grid, current_pos, came_from[current_pos], diagonal):
+            if dx and dy:
+                jump_index = jump_diagonal(grid, index, dx, dy, end_index)
+            else:
+                jump_index = jump_straight(grid, index, dx, dy, end_index, diagonal)
+            if jump_index is None:
+                continue
+
+            jump_point = grid.position(jump_index)
+
+            new_g = g + octile(current_pos, jump_point)
+            if jump_point not in best_g or new_g < best_g[jump_point]:
+                best_g[jump_point] = new_g
+                came_from[jump_point] = current_pos
+                h = heuristic(jump_point, end)
+                heapq.heappush(
+                    frontier, (new_g + h, h, next(counter), new_g, jump_point)
+                )
+
+    if stats is not None:
+        stats["expanded"] = expanded
+    return None
+
+
+def a_star_grid(maze, start, end, diagonal=False, stats=None):
+    grid = Grid(maze)
+    heuristic = octile if diagonal else manhattan
+    moves = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    if diagonal:
+        moves += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+    cells, width = grid.cells, grid.width
+
+    counter = count()
+    h = heuristic(start, end)
+    frontier = [(h, h, next(counter), 0, start)]
+    came_from = {start: None}
+    best_g = {start: 0}
+    expanded = 0
+
+    while frontier:
+        _, _, _, g, current_pos = heapq.heappop(frontier)
+        if g > best_g[current_pos]:
+            continue
+
+        expanded += 1
+        if current_pos == end:
+            if stats is not None:
+                stats["expanded"] = expanded
+            path = []
+            while current_pos is not None:
+                path.append(current_pos)
+                current_pos = came_from[current_pos]
+            return path[::-1]
+
+        x, y = current_pos
+        index = (x + 1) * width + y + 1
+        for dx, dy in moves:
+            if not cells[index + dx * width + dy]:
+                continue
+            if dx and dy and not (cells[index + dx * width] and cells[index + dy]):
+                continue
+
+            new_pos = (x + dx, y + dy)
+            new_g = g + (SQRT2 if dx and dy else 1)
+            if new_pos not in best_g or new_g < best_g[new_pos]:
+                best_g[new_pos] = new_g
+                came_from[new_pos] = current_pos
+                h = heuristic(new_pos, end)
+                heapq.heappush(frontier, (new_g + h, h, next(counter), new_g, new_pos))
+
+    if stats is not None:
+        stats["expanded"] = expanded
+    return None
+
+
+def path_cost(path):
+    return sum(octile(a, b) for a, b in zip(path, path[1:]))
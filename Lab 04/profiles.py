@@ -0,0 +1,232 @@
+import heapq
+from bisect import bisect_right
+
+import numpy as np
+
+DAY = 86400.0
+
+
+class TimeDependentGraph:
+    def __init__(self, offsets, targets, profile_offsets, times, values, names=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.profile_offsets = profile_offsets
+        self.times = times
+        self.values = values
+        self.names = names
+        self.index = None if names is None else {n: i for i, n in enumerate(names)}
+        self.period = DAY
+
+        self._offsets = memoryview(offsets)
+        self._targets = memoryview(targets)
+        self._profile_offsets = memoryview(profile_offsets)
+        self._times = memoryview(times)
+        self._values = memoryview(values)
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    def node_id(self, name):
+        return name if self.index is None else self.index[name]
+
+    def node_name(self, node):
+        return node if self.names is None else self.names[node]
+
+    def edges(self, node):
+        for edge in range(self._offsets[node], self._offsets[node + 1]):
+            yield self._targets[edge], edge
+
+    def travel_time(self, edge, departure):
+        lo, hi = self._profile_offsets[edge], self._profile_offsets[edge + 1]
+        times, values = self._times, self._values
+        if hi - lo == 1:
+            return values[lo]
+
+        t = departure % self.period
+        i = bisect_right(times, t, lo, hi) - 1
+        if i < lo:
+            t0, v0 = times[hi - 1] - self.period, values[hi - 1]
+            t1, v1 = times[lo], values[lo]
+        elif i == hi - 1:
+            t0, v0 = times[i], values[i]
+            t1, v1 = times[lo] + self.period, values[lo]
+        else:
+            t0, v0 = times[i], values[i]
+            t1, v1 = times[i + 1], values[i + 1]
+
+        return v0 + (v1 - v0) * (t - t0) / (t1 - t0)
+
+    def lower_bounds(self, goal):
+        goal = self.node_id(goal)
+        minimum = np.minimum.reduceat(self.values, self.profile_offsets[:-1])
+        sources = np.repeat(np.arange(self.num_nodes), np.diff(self.offsets))
+        order = np.argsort(self.targets, kind="stable")
+        reverse_offsets = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(self.targets, minlength=self.num_nodes), out=reverse_offsets[1:]
+        )
+        reverse_sources = sources[order].tolist()
+        reverse_costs = minimum[order].tolist()
+        reverse_offsets = reverse_offsets.tolist()
+
+        bound = [float("inf")] * self.num_nodes
+        bound[goal] = 0.0
+        queue = [(0.0, goal)]
+        while queue:
+            cost, node = heapq.heappop(queue)
+            if cost > bound[node]:
+                continue
+            for i in range(reverse_offsets[node], reverse_offsets[node + 1]):
+                new_cost = cost + reverse_costs[i]
+                if new_cost < bound[reverse_sources[i]]:
+                    bound[reverse_sources[i]] = new_cost
+                    heapq.heappush(queue, (new_cost, reverse_sources[i]))
+
+        return bound
+
+    @classmethod
+    def from_edges(cls, num_nodes, edges, names=None):
+        edges = sorted(edges, key=lambda edge: edge[0])
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount([u for u, _, _ in edges], minlength=num_nodes), out=offsets[1:]
+        )
+
+        profile_offsets = np.zeros(len(edges) + 1, dtype=np.int64)
+        np.cumsum([len(profile) for _, _, profile in edges], out=profile_offsets[1:])
+        points = [point for _, _, profile in edges for point in sorted(profile)]
+
+        return cls(
+            offsets,
+            np.array([v for _, v, _ in edges], dtype=np.int64),
+            profile_offsets,
+            np.array([t for t, _ in points], dtype=np.float64),
+            np.array([w for _, w in points], dtype=np.float64),
+            names,
+        )
+
+    @classmethod
+    def from_graph(cls, graph, profile=None):
+        names = list(graph)
+        index = {name: i for i, name in enumerate(names)}
+        edges = []
+        for node, neighbors in graph.items():
+            for neighbor, cost in neighbors.items():
+                points = [(0.0, cost)] if profile is None else profile(cost)
+                edges.append((index[node], index[neighbor], points))
+        return cls.from_edges(len(names), edges, names)
+
+    @classmethod
+    def load_dimacs(cls, filename):
+        num_nodes = 0
+        sources, targets, counts, times, values = [], [], [], [], []
+
+        with open(filename) as f:
+            for line in f:
+                if line.startswith("p"):
+                    num_nodes = int(line.split()[2]) + 1
+                elif line.startswith("a"):
+                    fields = line.split()
+                    sources.append(int(fields[1]))
+                    targets.append(int(fields[2]))
+                    if len(fields) == 4:
+                        counts.append(1)
+                        times.append(0.0)
+                        values.append(float(fields[3]))
+                    else:
+                        counts.append((len(fields) - 3) // 2)
+                        times.extend(map(float, fields[3::2]))
+                        values.extend(map(float, fields[4::2]))
+
+        sources = np.array(sources, dtype=np.int64)
+        counts = np.array(counts, dtype=np.int64)
+        profile_starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        order = np.argsort(sources, kind="stable")
+
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+        profile_offsets = np.zeros(len(order) + 1, dtype=np.int64)
+        np.cumsum(counts[order], out=profile_offsets[1:])
+        point_order = np.repeat(
+            profile_starts[order] - profile_offsets[:-1], counts[order]
+        ) + np.arange(profile_offsets[-1])
+
+        return cls(
+            offsets,
+            np.array(targets, dtype=np.int64)[order],
+            profile_offsets,
+            np.array(times, dtype=np.float64)[point_order],
+            np.array(values, dtype=np.float64)[point_order],
+        )
+
+
+def a_star_time_dependent(network, start, goal, departure, heuristic=None):
+    start, goal = network.node_id(start), network.node_id(goal)
+    if heuristic is None:
+        heuristic = [0.0] * network.num_nodes
+
+    frontier = [(departure + heuristic[start], departure, start)]
+    arrival = {start: departure}
+    came_from = {start: None}
+
+    while frontier:
+        _, current_time, current_node = heapq.heappop(frontier)
+
+        if current_time > arrival[current_node]:
+            continue
+
+        if current_node == goal:
+            path = []
+            while current_node is not None:
+                path.append(network.node_name(current_node))
+                current_node = came_from[current_node]
+            path.reverse()
+            return path, current_time
+
+        for neighbor, edge in network.edges(current_node):
+            new_time = current_time + network.travel_time(edge, current_time)
+            if neighbor not in arrival or new_time < arrival[neighbor]:
+                arrival[neighbor] = new_time
+                came_from[neighbor] = current_node
+                heapq.heappush(
+                    frontier, (new_time + heuristic[neighbor], new_time, neighbor)
+                )
+
+    return None
+
+
+def rush_hour(cost):
+    return [
+        (0.0, cost),
+        (7 * 3600.0, cost),
+        (8 * 3600.0, 3 * cost),
+        (10 * 3600.0, cost),
+        (16 * 3600.0, cost),
+        (17.5 * 3600.0, 2.5 * cost),
+        (19 * 3600.0, cost),
+    ]
+
+
+if __name__ == "__main__":
+    graph = {
+        "A": {"B": 4, "C": 2},
+        "B": {"A": 4, "D": 5, "E": 10},
+        "C": {"A": 2, "E": 8},
+        "D": {"B": 5, "F": 6},
+        "E": {"B": 10, "C": 8, "F": 3},
+        "F": {"D": 6, "E": 3, "G": 2},
+        "G": {"F": 2},
+    }
+
+    minutes = {
+        node: {n: c * 60 for n, c in edges.items()} for node, edges in graph.items()
+    }
+    network = TimeDependentGraph.from_graph(minutes, rush_hour)
+    bounds = network.lower_bounds("G")
+
+    for hour in [6, 8, 12, 18]:
+        path, arrival = a_star_time_dependent(network, "A", "G", hour * 3600.0, bounds)
+        print(
+            f"Leaving at {hour:02d}:00: {path}, {(arrival - hour * 3600) / 60:.1f} min"
+        )
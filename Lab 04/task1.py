@@ -1,34 +1,52 @@
-from queue import PriorityQueue
-from itertools import permutations
+import heapq
+from collections import deque
+from itertools import count
+
+import numpy as np
+
+from cache import path_cache
+
+TABLE_ENTRY_BYTES = 224
 
 
 class Node:
-    def __init__(self, position, parent=None):
+    __slots__ = ("position", "parent", "g")
+
+    def __init__(self, position, parent=None, g=0):
         self.position = position
         self.parent = parent
-        self.g = 0
-        self.h = 0
-        self.f = 0
-
-    def __lt__(self, other):
-        return self.f < other.f
+        self.g = g
 
 
 def heuristic(current_pos, end_pos):
     return abs(current_pos[0] - end_pos[0]) + abs(current_pos[1] - end_pos[1])
 
 
-def best_first_search(maze, start, end):
+def best_first_search(maze, start, end, mode="greedy", cache=None):
+    if cache is not None:
+        key = cache.key(maze, start, (end, mode))
+        hit, path = cache.lookup(key)
+        if not hit:
+            path = best_first_search(maze, start, end, mode)
+            cache.store(key, path and tuple(path))
+        return path and list(path)
+
+    if mode == "idastar":
+        return ida_star(maze, start, end)
+
     rows, cols = len(maze), len(maze[0])
-    start_node = Node(start)
-    frontier = PriorityQueue()
-    frontier.put(start_node)
-    visited = set()
+    astar = mode == "astar"
+    counter = count()
+    frontier = [(heuristic(start, end), 0, next(counter), Node(start))]
+    best_g = {start: 0}
 
-    while not frontier.empty():
-        current_node = frontier.get()
+    while frontier:
+        _, _, _, current_node = heapq.heappop(frontier)
         current_pos = current_node.position
 
+        if astar and current_node.g > best_g[current_pos]:
+            continue
+
         if current_pos == end:
             path = []
             while current_node:
@@ -36,63 +54,228 @@ def best_first_search(maze, start, end):
                 current_node = current_node.parent
             return path[::-1]
 
-        visited.add(current_pos)
-
+        new_g = current_node.g + 1
         for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
             new_pos = (current_pos[0] + dx, current_pos[1] + dy)
             if (
                 0 <= new_pos[0] < rows
                 and 0 <= new_pos[1] < cols
                 and maze[new_pos[0]][new_pos[1]] == 0
-                and new_pos not in visited
+                and (new_pos not in best_g or (astar and new_g < best_g[new_pos]))
             ):
-                new_node = Node(new_pos, current_node)
-                new_node.g = current_node.g + 1
-                new_node.h = heuristic(new_pos, end)
-                new_node.f = new_node.h
-                frontier.put(new_node)
-                visited.add(new_pos)
+                best_g[new_pos] = new_g
+                h = heuristic(new_pos, end)
+                priority = new_g + h if astar else h
+                heapq.heappush(
+                    frontier,
+                    (priority, h, next(counter), Node(new_pos, current_node, new_g)),
+                )
 
     return None
 
 
-def find_shortest_path_through_goals(maze, start, goals):
-    shortest_path = None
-    shortest_distance = float("inf")
+def ida_star(maze, start, end, table_bytes=16 << 20, stats=None):
+    rows, cols = len(maze), len(maze[0])
+    table_size = table_bytes // TABLE_ENTRY_BYTES
+    table = [None] * table_size
+    threshold = heuristic(start, end)
+    iteration = expanded = 0
+
+    def children(current_pos, g):
+        result = []
+        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+            new_pos = (current_pos[0] + dx, current_pos[1] + dy)
+            if (
+                0 <= new_pos[0] < rows
+                and 0 <= new_pos[1] < cols
+                and maze[new_pos[0]][new_pos[1]] == 0
+                and new_pos not in on_path
+            ):
+                result.append((g + 1 + heuristic(new_pos, end), new_pos))
+        result.sort()
+        return iter(result)
+
+    while True:
+        iteration += 1
+        path = [start]
+        on_path = {start}
+        stack = [children(start, 0)]
+        next_threshold = float("inf")
+
+        while stack and path[-1] != end:
+            child = next(stack[-1], None)
+            if child is None or child[0] > threshold:
+                if child is not None:
+                    next_threshold = min(next_threshold, child[0])
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+
+            new_pos = child[1]
+            g = len(path)
+            if table_size:
+                slot = hash(new_pos) % table_size
+                seen = table[slot]
+                if (
+                    seen is not None
+                    and seen[0] == new_pos
+                    and (seen[1] < g or (seen[1] == g and seen[2] == iteration))
+                ):
+                    continue
+                table[slot] = (new_pos, g, iteration)
+
+            expanded += 1
+            path.append(new_pos)
+            on_path.add(new_pos)
+            stack.append(children(new_pos, g))
+
+        if path or next_threshold == float("inf"):
+            if stats is not None:
+                stats["expanded"] = expanded
+                stats["iterations"] = iteration
+                stats["table"] = table_size - table.count(None)
+            return path or None
+        threshold = next_threshold
+
+
+def search_tree(maze, source, targets=()):
+    rows, cols = len(maze), len(maze[0])
+    parent = {source: None}
+    remaining = set(targets) - {source}
+    queue = deque([source])
+
+    while queue and (remaining or not targets):
+        current_pos = queue.popleft()
+        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+            new_pos = (current_pos[0] + dx, current_pos[1] + dy)
+            if (
+                0 <= new_pos[0] < rows
+                and 0 <= new_pos[1] < cols
+                and maze[new_pos[0]][new_pos[1]] == 0
+                and new_pos not in parent
+            ):
+                parent[new_pos] = current_pos
+                remaining.discard(new_pos)
+                queue.append(new_pos)
+
+    return parent
+
+
+def tree_path(parent, end):
+    path = []
+    while end is not None:
+        path.append(end)
+        end = parent[end]
+    return path[::-1]
+
+
+def held_karp_order(dist):
+    m = len(dist) - 1
+    full = 1 << m
+    inner = dist[1:, 1:]
+
+    dp = np.full((full, m), np.inf)
+    parent = np.full((full, m), -1, dtype=np.int8)
+    dp[1 << np.arange(m), np.arange(m)] = dist[0, 1:]
+
+    masks = np.arange(full)
+    popcount = np.zeros(full, dtype=np.int8)
+    for bit in range(m):
+        popcount += (masks >> bit) & 1
+
+    for size in range(2, m + 1):
+        layer = masks[popcount == size]
+        for last in range(m):
+            subsets = layer[(layer >> last) & 1 == 1]
+            cost = dp[subsets ^ (1 << last)] + inner[:, last]
+            best = cost.argmin(axis=1)
+            dp[subsets, last] = cost[np.arange(len(subsets)), best]
+            parent[subsets, last] = best
+
+    last = int(dp[full - 1].argmin())
+    order = []
+    mask = full - 1
+    while last != -1:
+        order.append(last + 1)
+        mask, last = mask ^ (1 << last), int(parent[mask, last])
+
+    return order[::-1]
+
+
+def two_opt_order(dist):
+    order = [0]
+    remaining = set(range(1, len(dist)))
+    while remaining:
+        nearest = min(remaining, key=lambda j: dist[order[-1], j])
+        order.append(nearest)
+        remaining.remove(nearest)
+
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, len(order) - 1):
+            for j in range(i + 1, len(order)):
+                a, b = order[i - 1], order[i]
+                c = order[j]
+                d = order[j + 1] if j + 1 < len(order) else None
+                before = dist[a, b] + (dist[c, d] if d is not None else 0)
+                after = dist[a, c] + (dist[b, d] if d is not None else 0)
+                if after < before:
+                    order[i : j + 1] = order[i : j + 1][::-1]
+                    improved = True
+
+    return order[1:]
+
+
+def find_shortest_path_through_goals(maze, start, goals, max_exact=18):
+    points = [start] + list(goals)
+    trees = [search_tree(maze, point, points) for point in points]
+
+    dist = np.full((len(points), len(points)), np.inf)
+    for i, tree in enumerate(trees):
+        for j, point in enumerate(points):
+            if point in tree:
+                dist[i, j] = len(tree_path(tree, point)) - 1
+
+    if np.isinf(dist[0]).any():
+        return None, float("inf")
+
+    if len(goals) <= max_exact:
+        order = held_karp_order(dist)
+    else:
+        order = two_opt_order(dist)
 
-    for perm in permutations(goals):
-        total_path = []
-        total_distance = 0
-        current_start = start
-        valid_path = True
+    total_path = [start]
+    total_distance = 0
+    current = 0
+    for goal in order:
+        total_path.extend(tree_path(trees[current], points[goal])[1:])
+        total_distance += int(dist[current, goal])
+        current = goal
 
-        for goal in perm:
-            path = best_first_search(maze, current_start, goal)
-            if path is None:
-                valid_path = False
-                break
-            total_path.extend(path[:-1])
-            total_distance += len(path) - 1
-            current_start = goal
+    return total_path, total_distance
 
-        if valid_path and total_distance < shortest_distance:
-            shortest_distance = total_distance
-            shortest_path = total_path + [perm[-1]]
 
-    return shortest_path, shortest_distance
+if __name__ == "__main__":
+    maze = [
+        [0, 0, 1, 0, 0],
+        [0, 0, 0, 0, 0],
+        [0, 0, 1, 0, 1],
+        [0, 0, 1, 0, 0],
+        [0, 0, 0, 1, 0],
+    ]
 
+    start = (0, 0)
+    goals = [(4, 4), (2, 3), (1, 4)]
 
-maze = [
-    [0, 0, 1, 0, 0],
-    [0, 0, 0, 0, 0],
-    [0, 0, 1, 0, 1],
-    [0, 0, 1, 0, 0],
-    [0, 0, 0, 1, 0],
-]
+    path, cost = find_shortest_path_through_goals(maze, start, goals)
+    print("Shortest path through all goals:", path)
+    print("Lowest cost through all goals:", cost)
 
-start = (0, 0)
-goals = [(4, 4), (2, 3), (1, 4)]
+    for goal in goals + goals:
+        best_first_search(maze, start, goal, "astar", path_cache)
+    print("Path cache:", path_cache.stats())
 
-path, cost = find_shortest_path_through_goals(maze, start, goals)
-print("Shortest path through all goals:", path)
-print("Lowest cost through all goals:", cost)
+    maze[1][1] = 1
+    best_first_search(maze, start, goals[0], "astar", path_cache)
+    print("Path cache after maze change:", path_cache.stats())
@@ -1,6 +1,11 @@
+import heapq
 import random
 import time
 
+from task4 import ara_star
+
+INF = float("inf")
+
 
 def a_star_dynamic(graph, start, goal, heuristic, max_iterations=20):
     frontier = [(start, heuristic[start])]
@@ -48,25 +53,158 @@ def a_star_dynamic(graph, start, goal, heuristic, max_iterations=20):
     return None
 
 
-graph = {
-    "A": {"B": 2, "C": 4},
-    "B": {"A": 2, "D": 7, "E": 3},
-    "C": {"A": 4, "E": 1},
-    "D": {"B": 7, "F": 2},
-    "E": {"B": 3, "C": 1, "F": 5},
-    "F": {"D": 2, "E": 5, "G": 1},
-    "G": {"F": 1},
-}
-
-heuristic = {
-    "A": 10,
-    "B": 8,
-    "C": 7,
-    "D": 5,
-    "E": 6,
-    "F": 3,
-    "G": 0,
-}
-
-print("\nRunning Dynamic A* Search:")
-a_star_dynamic(graph, "A", "G", heuristic)
+class LPAStar:
+    def __init__(self, graph, start, goal, heuristic):
+        self.graph = graph
+        self.start = start
+        self.goal = goal
+        self.heuristic = dict(heuristic)
+        self.predecessors = {node: {} for node in graph}
+        for node, edges in graph.items():
+            for neighbor, cost in edges.items():
+                self.predecessors.setdefault(neighbor, {})[node] = cost
+
+        self.g = {}
+        self.rhs = {start: 0}
+        self.frontier = []
+        self.keys = {}
+        self.expanded = 0
+        self.lower_heuristic(graph)
+        self.push(start)
+
+    def calculate_key(self, node):
+        best = min(self.g.get(node, INF), self.rhs.get(node, INF))
+        return (best + self.heuristic[node], best)
+
+    def push(self, node):
+        key = self.calculate_key(node)
+        self.keys[node] = key
+        heapq.heappush(self.frontier, (key, node))
+
+    def top_key(self):
+        while self.frontier:
+            key, node = self.frontier[0]
+            if self.keys.get(node) == key:
+                return key
+            heapq.heappop(self.frontier)
+        return (INF, INF)
+
+    def lower_heuristic(self, nodes):
+        queue = [(self.heuristic[node], node) for node in nodes]
+        heapq.heapify(queue)
+
+        while queue:
+            h, node = heapq.heappop(queue)
+            if h > self.heuristic[node]:
+                continue
+
+            for predecessor, cost in self.predecessors[node].items():
+                if cost + h < self.heuristic[predecessor]:
+                    self.heuristic[predecessor] = cost + h
+                    heapq.heappush(queue, (cost + h, predecessor))
+                    if predecessor in self.keys:
+                        self.push(predecessor)
+
+    def update_vertex(self, node):
+        if node != self.start:
+            self.rhs[node] = min(
+                (
+                    self.g.get(p, INF) + cost
+                    for p, cost in self.predecessors[node].items()
+                ),
+                default=INF,
+            )
+
+        self.keys.pop(node, None)
+        if self.g.get(node, INF) != self.rhs.get(node, INF):
+            self.push(node)
+
+    def update_edge(self, u, v, cost):
+        self.graph[u][v] = cost
+        self.predecessors.setdefault(v, {})[u] = cost
+        self.lower_heuristic([v])
+        self.update_vertex(v)
+
+    def compute_shortest_path(self):
+        goal = self.goal
+        while self.top_key() < self.calculate_key(goal) or self.rhs.get(
+            goal, INF
+        ) != self.g.get(goal, INF):
+            _, node = heapq.heappop(self.frontier)
+            del self.keys[node]
+            self.expanded += 1
+
+            if self.g.get(node, INF) > self.rhs.get(node, INF):
+                self.g[node] = self.rhs[node]
+            else:
+                self.g[node] = INF
+                self.update_vertex(node)
+
+            for neighbor in self.graph[node]:
+                self.update_vertex(neighbor)
+
+    def replan(self):
+        self.expanded = 0
+        self.compute_shortest_path()
+        if self.g.get(self.goal, INF) == INF:
+            return None
+
+        path = [self.goal]
+        while path[-1] != self.start:
+            predecessors = self.predecessors[path[-1]]
+            path.append(
+                min(predecessors, key=lambda p: self.g.get(p, INF) + predecessors[p])
+            )
+        path.reverse()
+        return path
+
+    def cost(self):
+        return self.g.get(self.goal, INF)
+
+
+if __name__ == "__main__":
+    graph = {
+        "A": {"B": 2, "C": 4},
+        "B": {"A": 2, "D": 7, "E": 3},
+        "C": {"A": 4, "E": 1},
+        "D": {"B": 7, "F": 2},
+        "E": {"B": 3, "C": 1, "F": 5},
+        "F": {"D": 2, "E": 5, "G": 1},
+        "G": {"F": 1},
+    }
+
+    heuristic = {
+        "A": 10,
+        "B": 8,
+        "C": 7,
+        "D": 5,
+        "E": 6,
+        "F": 3,
+        "G": 0,
+    }
+
+    traffic_graph = {node: dict(edges) for node, edges in graph.items()}
+
+    print("\nRunning Dynamic A* Search:")
+    a_star_dynamic(graph, "A", "G", heuristic)
+
+    print("\nRunning Incremental LPA* Replanning:")
+    planner = LPAStar(traffic_graph, "A", "G", heuristic)
+    path = planner.replan()
+    print(f"Initial path: {path}, cost {planner.cost()}, {planner.expanded} expansions")
+
+    for _ in range(3):
+        node = random.choice(path[:-1])
+        neighbor = path[path.index(node) + 1]
+        new_cost = traffic_graph[node][neighbor] + random.randint(1, 4)
+        planner.update_edge(node, neighbor, new_cost)
+        planner.update_edge(neighbor, node, new_cost)
+        path = planner.replan()
+        print(
+            f"Edge {node}-{neighbor} now costs {new_cost}. Path: {path}, "
+            f"cost {planner.cost()}, {planner.expanded} expansions"
+        )
+
+    print("\nRunning Anytime ARA* on the Updated Traffic:")
+    path, cost, bound = ara_star(traffic_graph, "A", "G", heuristic, 0.01)
+    print(f"Path: {path}, cost {cost}, within {bound:.2f}x of optimal")
@@ -1,12 +1,100 @@
 from queue import PriorityQueue
 
+import numpy as np
 
-def heuristic(current_pos, end_pos):
-    return abs(current_pos[0] - end_pos[0]) + abs(current_pos[1] - end_pos[1])
+INF = float("inf")
 
 
-def greedy_best_first_search(maze, start, deliveries):
+class DeliveryField:
+    def __init__(self, maze, deliveries):
+        rows, cols = len(maze), len(maze[0])
+        # The flattened grid gets a wall border so every neighbour index is
+        # in range; walls hold -1 so one comparison rejects them and settled
+        # cells alike.
+        self.width = cols + 2
+        self.steps = np.array([self.width, -self.width, 1, -1])
+        free = np.zeros((rows + 2, cols + 2), dtype=bool)
+        free[1:-1, 1:-1] = np.array(maze) == 0
+        self.dist = np.where(free.ravel(), INF, -1.0)
+        self.owner = np.full(self.dist.size, -1)
+        self.mark = np.zeros(self.dist.size, dtype=np.int64)
+        self.deliveries = {delivery: i for i, delivery in enumerate(deliveries)}
+
+        seeds = np.array([self.index(d) for d in self.deliveries], dtype=np.int64)
+        self.dist[seeds] = 0
+        self.owner[seeds] = list(self.deliveries.values())
+        self.spread({0: seeds})
+
+    def index(self, pos):
+        return (pos[0] + 1) * self.width + pos[1] + 1
+
+    def __getitem__(self, pos):
+        return self.dist[self.index(pos)]
+
+    def spread(self, pending):
+        dist, owner, mark = self.dist, self.owner, self.mark
+        frontier = np.empty(0, dtype=np.int64)
+        level = min(pending, default=0)
+
+        while pending or frontier.size:
+            if not frontier.size:
+                level = min(pending)
+            seeds = pending.pop(level, None)
+            if seeds is not None:
+                frontier = np.concatenate([frontier, seeds[dist[seeds] == level]])
+
+            cells = (frontier[:, None] + self.steps).ravel()
+            reached = np.flatnonzero(dist[cells] > level + 1)
+            cells = cells[reached]
+            dist[cells] = level + 1
+            owner[cells] = owner[frontier[reached // len(self.steps)]]
+            # Keep one copy of each cell reached from several sides.
+            mark[cells] = reached
+            frontier = cells[mark[cells] == reached]
+            level += 1
+
+    def remove(self, delivery):
+        index = self.deliveries.pop(delivery, None)
+        if index is None:
+            return
+
+        dist, owner = self.dist, self.owner
+        region = np.flatnonzero(owner == index)
+        dist[region] = INF
+        owner[region] = -1
+
+        # Seed each orphaned cell from its best neighbour outside the region,
+        # then grow the seeds level by level through the region only.
+        around = region[:, None] + self.steps
+        cost = np.where(dist[around] < 0, INF, dist[around])
+        around = around[np.arange(region.size), cost.argmin(axis=1)]
+        reached = (dist[around] >= 0) & (dist[around] < INF)
+        region, around = region[reached], around[reached]
+        dist[region] = dist[around] + 1
+        owner[region] = owner[around]
+
+        order = np.argsort(dist[region], kind="stable")
+        levels, starts = np.unique(dist[region][order], return_index=True)
+        self.spread(dict(zip(levels.tolist(), np.split(region[order], starts[1:]))))
+
+
+def greedy_best_first_search(maze, start, deliveries, cache=None):
+    if cache is not None:
+        key = cache.key(maze, start, tuple(sorted(deliveries.items())))
+        hit, route = cache.lookup(key)
+        if not hit:
+            route = greedy_best_first_search(maze, start, deliveries)
+            cache.store(key, tuple(route))
+            return route
+
+        for pos in route:
+            if pos in deliveries:
+                print(f"Delivered at {pos} within time window {deliveries[pos]}")
+                del deliveries[pos]
+        return list(route)
+
     rows, cols = len(maze), len(maze[0])
+    field = DeliveryField(maze, deliveries)
     frontier = PriorityQueue()
     frontier.put((0, start))
     visited = set()
@@ -25,6 +113,7 @@ def greedy_best_first_search(maze, start, deliveries):
             delivery_time = deliveries[current_pos]
             print(f"Delivered at {current_pos} within time window {delivery_time}")
             del deliveries[current_pos]
+            field.remove(current_pos)
 
         for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
             new_pos = (current_pos[0] + dx, current_pos[1] + dy)
@@ -34,31 +123,27 @@ def greedy_best_first_search(maze, start, deliveries):
                 and maze[new_pos[0]][new_pos[1]] == 0
                 and new_pos not in visited
             ):
-                priority = (
-                    min([heuristic(new_pos, d) for d in deliveries])
-                    if deliveries
-                    else 0
-                )
-                frontier.put((priority, new_pos))
+                frontier.put((field[new_pos], new_pos))
 
     return path
 
 
-maze = [
-    [0, 0, 1, 0, 0],
-    [0, 0, 0, 0, 0],
-    [0, 0, 1, 0, 1],
-    [0, 0, 1, 0, 0],
-    [0, 0, 0, 1, 0],
-]
-
-start = (0, 0)
-deliveries = {
-    (4, 4): (8, 12),
-    (2, 3): (5, 10),
-    (1, 4): (3, 7),
-}
-
-print("Optimized Delivery Route:")
-route = greedy_best_first_search(maze, start, deliveries)
-print("Route taken:", route)
+if __name__ == "__main__":
+    maze = [
+        [0, 0, 1, 0, 0],
+        [0, 0, 0, 0, 0],
+        [0, 0, 1, 0, 1],
+        [0, 0, 1, 0, 0],
+        [0, 0, 0, 1, 0],
+    ]
+
+    start = (0, 0)
+    deliveries = {
+        (4, 4): (8, 12),
+        (2, 3): (5, 10),
+        (1, 4): (3, 7),
+    }
+
+    print("Optimized Delivery Route:")
+    route = greedy_best_first_search(maze, start, deliveries)
+    print("Route taken:", route)
@@ -1,9 +1,30 @@
+import asyncio
 import heapq
 import random
 import time
+from functools import partial
 
 
-def a_star_real_time_traffic(graph, start, goal, heuristic, max_iterations=50):
+class SimulatedClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def apply_traffic(graph, node):
+    for neighbor in graph[node]:
+        traffic_change = random.randint(-2, 3)
+        graph[node][neighbor] = max(1, graph[node][neighbor] + traffic_change)
+
+
+def a_star_real_time_traffic(
+    graph, start, goal, heuristic, max_iterations=50, clock=time
+):
     frontier = []
     heapq.heappush(frontier, (heuristic[start], start))
     visited = set()
@@ -29,11 +50,7 @@ def a_star_real_time_traffic(graph, start, goal, heuristic, max_iterations=50):
             print(f"Goal found! Fastest route: {path}")
             return path
 
-        for neighbor in graph[current_node]:
-            traffic_change = random.randint(-2, 3)
-            graph[current_node][neighbor] = max(
-                1, graph[current_node][neighbor] + traffic_change
-            )
+        apply_traffic(graph, current_node)
 
         for neighbor, cost in graph[current_node].items():
             new_g_cost = g_costs[current_node] + cost
@@ -45,23 +62,262 @@ def a_star_real_time_traffic(graph, start, goal, heuristic, max_iterations=50):
                 heapq.heappush(frontier, (f_cost, neighbor))
 
         iteration += 1
-        time.sleep(0.5)
+        clock.sleep(0.5)
 
     print("Goal not found within iteration limit.")
     return None
 
 
-graph = {
-    "A": {"B": 4, "C": 2},
-    "B": {"A": 4, "D": 5, "E": 10},
-    "C": {"A": 2, "E": 8},
-    "D": {"B": 5, "F": 6},
-    "E": {"B": 10, "C": 8, "F": 3},
-    "F": {"D": 6, "E": 3, "G": 2},
-    "G": {"F": 2},
-}
+def a_star_search(graph, start, goal, heuristic):
+    frontier = [(heuristic[start], 0, start)]
+    g_costs = {start: 0}
+    came_from = {start: None}
+
+    while frontier:
+        _, g_cost, current_node = heapq.heappop(frontier)
+
+        if g_cost > g_costs[current_node]:
+            continue
+
+        if current_node == goal:
+            path = []
+            while current_node is not None:
+                path.append(current_node)
+                current_node = came_from[current_node]
+            path.reverse()
+            return path, g_cost
+
+        for neighbor, cost in graph[current_node].items():
+            new_g_cost = g_cost + cost
+            if neighbor not in g_costs or new_g_cost < g_costs[neighbor]:
+                g_costs[neighbor] = new_g_cost
+                came_from[neighbor] = current_node
+                heapq.heappush(
+                    frontier, (new_g_cost + heuristic[neighbor], new_g_cost, neighbor)
+                )
+
+    return None
+
+
+def consistent_heuristic(graph, heuristic, goal):
+    predecessors = {node: {} for node in graph}
+    for node, edges in graph.items():
+        for neighbor, cost in edges.items():
+            predecessors.setdefault(neighbor, {})[node] = cost
+
+    heuristic = dict(heuristic)
+    heuristic[goal] = 0
+    queue = [(h, node) for node, h in heuristic.items()]
+    heapq.heapify(queue)
+    while queue:
+        h, node = heapq.heappop(queue)
+        if h > heuristic[node]:
+            continue
+        for predecessor, cost in predecessors.get(node, {}).items():
+            if cost + h < heuristic[predecessor]:
+                heuristic[predecessor] = cost + h
+                heapq.heappush(queue, (cost + h, predecessor))
+    return heuristic
+
+
+def ara_star(
+    graph,
+    start,
+    goal,
+    heuristic,
+    time_limit,
+    epsilon=3.0,
+    step=0.5,
+    clock=time,
+    consistent=False,
+    stats=None,
+):
+    deadline = clock.time() + time_limit
+    if not consistent:
+        heuristic = consistent_heuristic(graph, heuristic, goal)
+    g_costs = {start: 0}
+    came_from = {start: None}
+    opened, closed, inconsistent = {start}, set(), set()
+    frontier = [(epsilon * heuristic[start], 0, start)]
+    best = None
+    expanded = 0
+
+    def improve_path(epsilon):
+        nonlocal expanded
+        while frontier:
+            key, g_cost, current_node = frontier[0]
+            if current_node not in opened or g_cost != g_costs[current_node]:
+                heapq.heappop(frontier)
+                continue
+            if g_costs.get(goal, float("inf")) <= key:
+                return True
+            if best is not None and clock.time() > deadline:
+                return False
+
+            heapq.heappop(frontier)
+            opened.discard(current_node)
+            closed.add(current_node)
+            expanded += 1
+
+            for neighbor, cost in graph[current_node].items():
+                new_g_cost = g_cost + cost
+                if new_g_cost < g_costs.get(neighbor, float("inf")):
+                    g_costs[neighbor] = new_g_cost
+                    came_from[neighbor] = current_node
+                    if neighbor in closed:
+                        inconsistent.add(neighbor)
+                    else:
+                        opened.add(neighbor)
+                        heapq.heappush(
+                            frontier,
+                            (
+                                new_g_cost + epsilon * heuristic[neighbor],
+                                new_g_cost,
+                                neighbor,
+                            ),
+                        )
+        return True
+
+    while True:
+        finished = improve_path(epsilon)
+        if goal not in g_costs:
+            break
+
+        cost = g_costs[goal]
+        lower = min(
+            (g_costs[node] + heuristic[node] for node in opened | inconsistent),
+            default=cost,
+        )
+        ratio = cost / lower if lower > 0 else 1.0
+        bound = max(1.0, min(epsilon if finished else float("inf"), ratio))
+        if best is None or cost < best[1] or bound < best[2]:
+            path = [goal]
+            while came_from[path[-1]] is not None:
+                path.append(came_from[path[-1]])
+            best = (path[::-1], cost, bound)
+
+        if not finished or bound <= 1.0 or clock.time() > deadline:
+            break
+
+        epsilon = max(1.0, epsilon - step)
+        opened |= inconsistent
+        inconsistent.clear()
+        closed.clear()
+        frontier = [
+            (g_costs[node] + epsilon * heuristic[node], g_costs[node], node)
+            for node in opened
+        ]
+        heapq.heapify(frontier)
+
+    if stats is not None:
+        stats["expanded"] = expanded
+        stats["epsilon"] = epsilon
+    return best
+
+
+class RoutingService:
+    def __init__(self, graph, heuristic, time_limit=None):
+        self.snapshot = {node: dict(edges) for node, edges in graph.items()}
+        self.heuristic = heuristic
+        self.time_limit = time_limit
+        self.version = 0
+        self.repaired = {}
+        self.latencies = []
+
+    def publish(self, graph):
+        self.snapshot = graph
+        self.version += 1
+        self.repaired = {}
+
+    async def route(self, start, goal):
+        loop = asyncio.get_running_loop()
+        begin = time.perf_counter()
+        if self.time_limit is None:
+            result = await loop.run_in_executor(
+                None, a_star_search, self.snapshot, start, goal, self.heuristic
+            )
+        else:
+            # The repaired heuristic only changes with the snapshot, so each
+            # version builds it once per goal and later requests await it.
+            graph = self.snapshot
+            if goal not in self.repaired:
+                self.repaired[goal] = loop.run_in_executor(
+                    None, consistent_heuristic, graph, self.heuristic, goal
+                )
+            heuristic = await self.repaired[goal]
+            result = await loop.run_in_executor(
+                None,
+                partial(ara_star, consistent=True),
+                graph,
+                start,
+                goal,
+                heuristic,
+                self.time_limit,
+            )
+        self.latencies.append(time.perf_counter() - begin)
+        return result
+
+    def report(self, elapsed):
+        latencies = sorted(self.latencies)
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        return len(latencies) / elapsed, p99
+
+
+async def traffic_source(service, stop, interval=0.5, clock=None):
+    while not stop.is_set():
+        graph = {node: dict(edges) for node, edges in service.snapshot.items()}
+        apply_traffic(graph, random.choice(list(graph)))
+        service.publish(graph)
+
+        if clock is None:
+            await asyncio.sleep(interval)
+        else:
+            clock.sleep(interval)
+            await asyncio.sleep(0)
+
+
+async def simulate_traffic(graph, heuristic, requests, clock=None):
+    service = RoutingService(graph, heuristic)
+    stop = asyncio.Event()
+    source = asyncio.create_task(traffic_source(service, stop, clock=clock))
+
+    begin = time.perf_counter()
+    routes = await asyncio.gather(
+        *(service.route(start, goal) for start, goal in requests)
+    )
+    elapsed = time.perf_counter() - begin
+
+    stop.set()
+    await source
+    return routes, service.version, service.report(elapsed)
+
+
+if __name__ == "__main__":
+    graph = {
+        "A": {"B": 4, "C": 2},
+        "B": {"A": 4, "D": 5, "E": 10},
+        "C": {"A": 2, "E": 8},
+        "D": {"B": 5, "F": 6},
+        "E": {"B": 10, "C": 8, "F": 3},
+        "F": {"D": 6, "E": 3, "G": 2},
+        "G": {"F": 2},
+    }
+
+    heuristic = {"A": 10, "B": 8, "C": 7, "D": 5, "E": 6, "F": 3, "G": 0}
+
+    print("\nRunning A* with Real-Time Traffic Updates:")
+    a_star_real_time_traffic(graph, "A", "G", heuristic)
 
-heuristic = {"A": 10, "B": 8, "C": 7, "D": 5, "E": 6, "F": 3, "G": 0}
+    print("\nRunning Anytime ARA* with a 10ms Deadline:")
+    path, cost, bound = ara_star(graph, "A", "G", heuristic, 0.01)
+    print(f"Route: {path}, cost {cost}, within {bound:.2f}x of optimal")
 
-print("\nRunning A* with Real-Time Traffic Updates:")
-a_star_real_time_traffic(graph, "A", "G", heuristic)
+    print("\nRunning Routing Service with Simulated Traffic Clock:")
+    nodes = list(graph)
+    requests = [(random.choice(nodes), "G") for _ in range(2000)]
+    routes, versions, (qps, p99) = asyncio.run(
+        simulate_traffic(graph, heuristic, requests, clock=SimulatedClock())
+    )
+    print(f"Example route: {routes[0]}")
+    print(f"Answered {len(routes)} requests across {versions} traffic snapshots")
+    print(f"Throughput: {qps:.0f} queries/sec, p99 latency: {p99 * 1000:.2f}ms")
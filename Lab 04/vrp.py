@@ -0,0 +1,223 @@
+import time
+
+import numpy as np
+
+INF = float("inf")
+
+
+def maze_distances(maze, points):
+    free = np.asarray(maze) == 0
+    rows, cols = free.shape
+    targets = np.array([i * cols + j for i, j in points])
+    matrix = np.full((len(points), len(points)), INF)
+
+    for row, source in enumerate(targets):
+        dist = np.full(rows * cols, -1, dtype=np.int32)
+        unvisited = free.ravel().copy()
+        unvisited[source] = False
+        dist[source] = 0
+        frontier = np.array([source])
+
+        depth = 0
+        while len(frontier):
+            depth += 1
+            col = frontier % cols
+            reached = []
+            for candidates in (
+                frontier[frontier < (rows - 1) * cols] + cols,
+                frontier[frontier >= cols] - cols,
+                frontier[col != cols - 1] + 1,
+                frontier[col != 0] - 1,
+            ):
+                candidates = candidates[unvisited[candidates]]
+                unvisited[candidates] = False
+                reached.append(candidates)
+            frontier = np.concatenate(reached)
+            dist[frontier] = depth
+
+        found = dist[targets]
+        matrix[row, found >= 0] = found[found >= 0]
+
+    return matrix
+
+
+class Route:
+    def __init__(self, problem):
+        self.problem = problem
+        self.nodes = [0, 0]
+        self.update()
+
+    def update(self):
+        problem = self.problem
+        nodes = self.nodes
+        begin = [0.0] * len(nodes)
+        for k in range(1, len(nodes)):
+            arrival = (
+                begin[k - 1]
+                + problem.service[nodes[k - 1]]
+                + problem.dist[nodes[k - 1], nodes[k]]
+            )
+            begin[k] = max(arrival, problem.ready[nodes[k]])
+
+        latest = [INF] * len(nodes)
+        for k in range(len(nodes) - 2, -1, -1):
+            latest[k] = min(
+                problem.due[nodes[k]],
+                latest[k + 1]
+                - problem.service[nodes[k]]
+                - problem.dist[nodes[k], nodes[k + 1]],
+            )
+
+        self.begin = np.array(begin)
+        self.latest = np.array(latest)
+        self.array = np.array(nodes)
+
+    def length(self):
+        return self.problem.dist[self.array[:-1], self.array[1:]].sum()
+
+    def best_insertion(self, customer):
+        problem = self.problem
+        before, after = self.array[:-1], self.array[1:]
+        to_customer = problem.dist[before, customer]
+        from_customer = problem.dist[customer, after]
+
+        begin = np.maximum(
+            self.begin[:-1] + problem.service[before] + to_customer,
+            problem.ready[customer],
+        )
+        feasible = (begin <= problem.due[customer]) & (
+            begin + problem.service[customer] + from_customer <= self.latest[1:]
+        )
+        if not feasible.any():
+            return INF, None
+
+        delta = to_customer + from_customer - problem.dist[before, after]
+        delta[~feasible] = INF
+        position = int(delta.argmin())
+        return delta[position], position + 1
+
+    def insert(self, customer, position):
+        self.nodes.insert(position, customer)
+        self.update()
+
+    def remove(self, customer):
+        self.nodes.remove(customer)
+        self.update()
+
+
+class DeliveryProblem:
+    def __init__(self, maze, depot, deliveries, service=0):
+        self.points = [depot] + list(deliveries)
+        self.dist = maze_distances(maze, self.points)
+        self.ready = np.array(
+            [0] + [window[0] for window in deliveries.values()], float
+        )
+        self.due = np.array([INF] + [window[1] for window in deliveries.values()])
+        self.service = np.full(len(self.points), float(service))
+        self.service[0] = 0
+
+    def solve(self, vehicles, passes=3):
+        start = time.perf_counter()
+        routes = [Route(self) for _ in range(vehicles)]
+        unserved = []
+
+        for customer in sorted(range(1, len(self.points)), key=lambda c: self.due[c]):
+            cost, route, position = self.cheapest(routes, customer)
+            if route is None:
+                unserved.append(customer)
+            else:
+                route.insert(customer, position)
+
+        initial_distance = float(sum(route.length() for route in routes))
+        for _ in range(passes):
+            improved = False
+            for route in routes:
+                for customer in list(route.nodes[1:-1]):
+                    position = route.nodes.index(customer)
+                    prev, next = route.nodes[position - 1], route.nodes[position + 1]
+                    saving = (
+                        self.dist[prev, customer]
+                        + self.dist[customer, next]
+                        - self.dist[prev, next]
+                    )
+                    route.remove(customer)
+                    cost, best, best_position = self.cheapest(routes, customer)
+                    if best is not None and cost < saving:
+                        best.insert(customer, best_position)
+                        improved = True
+                    else:
+                        route.insert(customer, position)
+
+            for customer in list(unserved):
+                cost, route, position = self.cheapest(routes, customer)
+                if route is not None:
+                    route.insert(customer, position)
+                    unserved.remove(customer)
+                    improved = True
+
+            if not improved:
+                break
+
+        return {
+            "routes": [
+                [self.points[node] for node in route.nodes]
+                for route in routes
+                if len(route.nodes) > 2
+            ],
+            "distance": float(sum(route.length() for route in routes)),
+            "initial_distance": initial_distance,
+            "served": len(self.points) - 1 - len(unserved),
+            "unserved": [self.points[customer] for customer in unserved],
+            "runtime": time.perf_counter() - start,
+        }
+
+    def cheapest(self, routes, customer):
+        best = (INF, None, None)
+        for route in routes:
+            cost, position = route.best_insertion(customer)
+            if cost < best[0]:
+                best = (cost, route, position)
+        return best
+
+
+if __name__ == "__main__":
+    import random
+
+    from bench_maze import random_maze
+
+    maze = [
+        [0, 0, 1, 0, 0],
+        [0, 0, 0, 0, 0],
+        [0, 0, 1, 0, 1],
+        [0, 0, 1, 0, 0],
+        [0, 0, 0, 1, 0],
+    ]
+    deliveries = {
+        (4, 4): (8, 12),
+        (2, 3): (5, 10),
+        (1, 4): (3, 7),
+    }
+    solution = DeliveryProblem(maze, (0, 0), deliveries).solve(vehicles=1)
+    print("Time-window route:", solution["routes"])
+    print("Distance:", solution["distance"])
+
+    size, count, vehicles = 200, 2000, 25
+    rng = random.Random(0)
+    maze = random_maze(size, size, density=0.2)
+    deliveries = {}
+    while len(deliveries) < count:
+        pos = (rng.randrange(size), rng.randrange(size))
+        maze[pos[0]][pos[1]] = 0
+        opens = rng.randrange(0, 2000)
+        deliveries[pos] = (opens, opens + rng.randrange(200, 800))
+
+    start = time.perf_counter()
+    problem = DeliveryProblem(maze, (0, 0), deliveries, service=2)
+    matrix_time = time.perf_counter() - start
+    solution = problem.solve(vehicles)
+    print(
+        f"\n{count} deliveries, {vehicles} vehicles: served {solution['served']}, "
+        f"distance {solution['distance']:.0f} (insertion only: "
+        f"{solution['initial_distance']:.0f}), {len(solution['routes'])} routes used"
+    )
+    print(f"Distance matrix {matrix_time:.1f}s, routing {solution['runtime']:.1f}s")
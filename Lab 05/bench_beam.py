@@ -0,0 +1,61 @@
+import random
+import sys
+import time
+
+from task1 import beam_search, evaluate_board, generate_random_position
+
+
+def beam_search_copy(board, beam_width, depth_limit):
+    if depth_limit == 0:
+        return [], evaluate_board(board)
+
+    candidates = []
+    for move in board.legal_moves:
+        board_copy = board.copy()
+        board_copy.push(move)
+        candidates.append((move, evaluate_board(board_copy)))
+
+    candidates.sort(key=lambda x: x[1], reverse=not board.turn)
+    candidates = candidates[:beam_width]
+
+    best_sequence = []
+    best_score = float("-inf") if board.turn else float("inf")
+    for move, _ in candidates:
+        board_copy = board.copy()
+        board_copy.push(move)
+        subsequent_sequence, score = beam_search_copy(
+            board_copy, beam_width, depth_limit - 1
+        )
+        if (board.turn and score > best_score) or (
+            not board.turn and score < best_score
+        ):
+            best_score = score
+            best_sequence = [move] + subsequent_sequence
+
+    return best_sequence, best_score
+
+
+def timed(search, boards, beam_width, depth_limit):
+    start = time.perf_counter()
+    for board in boards:
+        search(board, beam_width, depth_limit)
+    return (time.perf_counter() - start) / len(boards)
+
+
+if __name__ == "__main__":
+    widths = (
+        [int(w) for w in sys.argv[1].split(",")] if len(sys.argv) > 1 else [2, 5, 8]
+    )
+    depths = [int(d) for d in sys.argv[2].split(",")] if len(sys.argv) > 2 else [3, 5]
+
+    random.seed(0)
+    boards = [generate_random_position(20) for _ in range(5)]
+
+    for depth_limit in depths:
+        for beam_width in widths:
+            before = timed(beam_search_copy, boards, beam_width, depth_limit)
+            after = timed(beam_search, boards, beam_width, depth_limit)
+            print(
+                f"width {beam_width} depth {depth_limit}: copy {before:.3f}s, "
+                f"make/unmake {after:.3f}s ({before / after:.1f}x)"
+            )
@@ -0,0 +1,45 @@
+import random
+import time
+
+import chess
+
+from task1 import PIECE_VALUES, evaluate_board, generate_random_position
+
+
+def evaluate_board_squares(board):
+    if board.is_checkmate():
+        return -10000 if board.turn else 10000
+    if board.is_stalemate() or board.is_insufficient_material():
+        return 0
+
+    score = 0
+    for square in chess.SQUARES:
+        piece = board.piece_at(square)
+        if piece:
+            value = PIECE_VALUES[piece.piece_type]
+            if piece.color == chess.WHITE:
+                score += value
+            else:
+                score -= value
+    return score
+
+
+def evaluations_per_second(evaluate, boards, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for board in boards:
+            evaluate(board)
+    return repeat * len(boards) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    boards = [generate_random_position(random.randint(0, 60)) for _ in range(2000)]
+
+    for name, evaluate in [
+        ("squares", evaluate_board_squares),
+        ("bitboard", evaluate_board),
+        ("bitboard+pst", lambda board: evaluate_board(board, piece_square=True)),
+    ]:
+        rate = evaluations_per_second(evaluate, boards)
+        print(f"{name:>12}: {rate:,.0f} evaluations/sec")
@@ -1,35 +1,170 @@
 import chess
 import random
 
+PIECE_VALUES = {
+    chess.PAWN: 100,
+    chess.KNIGHT: 320,
+    chess.BISHOP: 330,
+    chess.ROOK: 500,
+    chess.QUEEN: 900,
+    chess.KING: 20000,
+}
+
+PIECE_SQUARE_TABLES = {
+    chess.PAWN: [
+        [0, 0, 0, 0, 0, 0, 0, 0],
+        [50, 50, 50, 50, 50, 50, 50, 50],
+        [10, 10, 20, 30, 30, 20, 10, 10],
+        [5, 5, 10, 25, 25, 10, 5, 5],
+        [0, 0, 0, 20, 20, 0, 0, 0],
+        [5, -5, -10, 0, 0, -10, -5, 5],
+        [5, 10, 10, -20, -20, 10, 10, 5],
+        [0, 0, 0, 0, 0, 0, 0, 0],
+    ],
+    chess.KNIGHT: [
+        [-50, -40, -30, -30, -30, -30, -40, -50],
+        [-40, -20, 0, 0, 0, 0, -20, -40],
+        [-30, 0, 10, 15, 15, 10, 0, -30],
+        [-30, 5, 15, 20, 20, 15, 5, -30],
+        [-30, 0, 15, 20, 20, 15, 0, -30],
+        [-30, 5, 10, 15, 15, 10, 5, -30],
+        [-40, -20, 0, 5, 5, 0, -20, -40],
+        [-50, -40, -30, -30, -30, -30, -40, -50],
+    ],
+    chess.BISHOP: [
+        [-20, -10, -10, -10, -10, -10, -10, -20],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-10, 0, 5, 10, 10, 5, 0, -10],
+        [-10, 5, 5, 10, 10, 5, 5, -10],
+        [-10, 0, 10, 10, 10, 10, 0, -10],
+        [-10, 10, 10, 10, 10, 10, 10, -10],
+        [-10, 5, 0, 0, 0, 0, 5, -10],
+        [-20, -10, -10, -10, -10, -10, -10, -20],
+    ],
+    chess.ROOK: [
+        [0, 0, 0, 0, 0, 0, 0, 0],
+        [5, 10, 10, 10, 10, 10, 10, 5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [0, 0, 0, 5, 5, 0, 0, 0],
+    ],
+    chess.QUEEN: [
+        [-20, -10, -10, -5, -5, -10, -10, -20],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-10, 0, 5, 5, 5, 5, 0, -10],
+        [-5, 0, 5, 5, 5, 5, 0, -5],
+        [0, 0, 5, 5, 5, 5, 0, -5],
+        [-10, 5, 5, 5, 5, 5, 0, -10],
+        [-10, 0, 5, 0, 0, 0, 0, -10],
+        [-20, -10, -10, -5, -5, -10, -10, -20],
+    ],
+    chess.KING: [
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-20, -30, -30, -40, -40, -30, -30, -20],
+        [-10, -20, -20, -20, -20, -20, -20, -10],
+        [20, 20, 0, 0, 0, 0, 20, 20],
+        [20, 30, 10, 0, 0, 10, 30, 20],
+    ],
+}
+
+
+def square_values(piece_type, color):
+    table = PIECE_SQUARE_TABLES[piece_type]
+    sign = 1 if color == chess.WHITE else -1
+    values = []
+    for square in chess.SQUARES:
+        rank = chess.square_rank(square)
+        row = table[7 - rank if color == chess.WHITE else rank]
+        values.append(
+            sign * (PIECE_VALUES[piece_type] + row[chess.square_file(square)])
+        )
+    return values
 
-def evaluate_board(board):
-    if board.is_checkmate():
-        return -10000 if board.turn else 10000
-    if board.is_stalemate() or board.is_insufficient_material():
-        return 0
 
-    piece_values = {
-        chess.PAWN: 100,
-        chess.KNIGHT: 320,
-        chess.BISHOP: 330,
-        chess.ROOK: 500,
-        chess.QUEEN: 900,
-        chess.KING: 20000,
+SQUARE_VALUES = {
+    color: {
+        piece_type: square_values(piece_type, color) for piece_type in chess.PIECE_TYPES
     }
+    for color in chess.COLORS
+}
 
-    score = 0
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece:
-            value = piece_values[piece.piece_type]
-            if piece.color == chess.WHITE:
-                score += value
-            else:
-                score -= value
+MATERIAL_VALUES = {
+    color: {
+        piece_type: [sign * PIECE_VALUES[piece_type]] * 64
+        for piece_type in chess.PIECE_TYPES
+    }
+    for color, sign in ((chess.WHITE, 1), (chess.BLACK, -1))
+}
+
+
+def terminal_score(board):
+    if not any(board.generate_legal_moves()):
+        if board.is_check():
+            return -10000 if board.turn else 10000
+        return 0
+    if board.is_insufficient_material():
+        return 0
+    return None
 
+
+def static_score(board, piece_square=False):
+    score = 0
+    if piece_square:
+        for piece_type in chess.PIECE_TYPES:
+            for color in chess.COLORS:
+                values = SQUARE_VALUES[color][piece_type]
+                for square in chess.scan_forward(board.pieces_mask(piece_type, color)):
+                    score += values[square]
+        return score
+
+    for piece_type, value in PIECE_VALUES.items():
+        score += value * (
+            chess.popcount(board.pieces_mask(piece_type, chess.WHITE))
+            - chess.popcount(board.pieces_mask(piece_type, chess.BLACK))
+        )
     return score
 
 
+def evaluate_board(board, piece_square=False):
+    terminal = terminal_score(board)
+    if terminal is not None:
+        return terminal
+    return static_score(board, piece_square)
+
+
+def move_delta(board, move, values):
+    own = values[board.turn]
+    piece_type = board.piece_type_at(move.from_square)
+    delta = (
+        own[move.promotion or piece_type][move.to_square]
+        - own[piece_type][move.from_square]
+    )
+
+    if board.is_castling(move):
+        rank = chess.square_rank(move.from_square)
+        if board.is_kingside_castling(move):
+            rook_from, rook_to = chess.square(7, rank), chess.square(5, rank)
+        else:
+            rook_from, rook_to = chess.square(0, rank), chess.square(3, rank)
+        delta += own[chess.ROOK][rook_to] - own[chess.ROOK][rook_from]
+    elif board.is_en_passant(move):
+        captured = chess.square(
+            chess.square_file(move.to_square), chess.square_rank(move.from_square)
+        )
+        delta -= values[not board.turn][chess.PAWN][captured]
+    else:
+        captured = board.piece_type_at(move.to_square)
+        if captured:
+            delta -= values[not board.turn][captured][move.to_square]
+    return delta
+
+
 def generate_random_position(moves=20):
     board = chess.Board()
     for _ in range(moves):
@@ -39,16 +174,27 @@ def generate_random_position(moves=20):
     return board
 
 
-def beam_search(board, beam_width, depth_limit):
+def beam_search(board, beam_width, depth_limit, piece_square=False, score=None):
+    if score is None:
+        score = static_score(board, piece_square)
     if depth_limit == 0:
-        return [], evaluate_board(board)
+        terminal = terminal_score(board)
+        return [], score if terminal is None else terminal
 
+    values = SQUARE_VALUES if piece_square else MATERIAL_VALUES
     candidates = []
     for move in board.legal_moves:
-        board_copy = board.copy()
-        board_copy.push(move)
-        score = evaluate_board(board_copy)
-        candidates.append((move, score))
+        child_score = score + move_delta(board, move, values)
+        priority = child_score
+        if board.gives_check(move):
+            board.push(move)
+            if not any(board.generate_legal_moves()):
+                priority = -10000 if board.turn else 10000
+            board.pop()
+        candidates.append((move, priority, child_score))
+
+    if not candidates:
+        return [], terminal_score(board)
 
     candidates.sort(key=lambda x: x[1], reverse=not board.turn)
     candidates = candidates[:beam_width]
@@ -56,13 +202,12 @@ def beam_search(board, beam_width, depth_limit):
     best_sequence = []
     best_score = float("-inf") if board.turn else float("inf")
 
-    for move, _ in candidates:
-        board_copy = board.copy()
-        board_copy.push(move)
-
+    for move, _, child_score in candidates:
+        board.push(move)
         subsequent_sequence, score = beam_search(
-            board_copy, beam_width, depth_limit - 1
+            board, beam_width, depth_limit - 1, piece_square, child_score
         )
+        board.pop()
 
         if (board.turn and score > best_score) or (
             not board.turn and score < best_score